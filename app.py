@@ -4,10 +4,13 @@ Business Card Generator v4.0 - FastAPI Web Service
 Enterprise-ready API with async support, job queuing, and comprehensive monitoring
 """
 
+import asyncio
 import os
 import sys
-import asyncio
-import uuid
+import logging
+import logging.handlers
+import queue
+import hashlib
 import time
 from pathlib import Path
 from datetime import datetime
@@ -17,25 +20,42 @@ from contextlib import asynccontextmanager
 # Add src to path
 sys.path.append(str(Path(__file__).parent / "src"))
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Depends
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, HTTPException, Request, Depends, Query
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 import structlog
-import redis
-from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
+from ulid import ULID
+from redis import asyncio as aioredis
+from prometheus_client import Counter
+from prometheus_fastapi_instrumentator import Instrumentator
 
 # Import our core modules
-from hybrid.modern_workflow import ModernHybridWorkflow, ModelType, GenerationResult
 from cache.redis_cache import GenerationCache
-from batch.batch_processor import BatchProcessor
 from monitoring.metrics import MetricsCollector
+from jobs.job_store import JobStore
+from web.static_files import PrecompressedStaticFiles, precompress_directory
+from celery_app import celery_app
 
 # Configure structured logging
+# Records are handed to a queue and written to stderr by a listener thread,
+# so a slow log pipe never blocks the event loop
+log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(
+    log_queue,
+    logging.StreamHandler(sys.stderr),
+    respect_handler_level=True
+)
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(message)s",
+    handlers=[logging.handlers.QueueHandler(log_queue)],
+    force=True
+)
+
 structlog.configure(
     processors=[
         structlog.stdlib.filter_by_level,
@@ -43,27 +63,27 @@ structlog.configure(
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
         structlog.processors.JSONRenderer()
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
+    # a* methods (await logger.ainfo(...)) render and emit in a worker thread
+    wrapper_class=structlog.stdlib.BoundLogger,
     cache_logger_on_first_use=True,
 )
 
 logger = structlog.get_logger()
 
 # Prometheus metrics
-REQUESTS = Counter('requests_total', 'Total requests', ['method', 'endpoint'])
-REQUEST_DURATION = Histogram('request_duration_seconds', 'Request duration')
 GENERATION_REQUESTS = Counter('generation_requests_total', 'Generation requests', ['model', 'concept'])
-GENERATION_DURATION = Histogram('generation_duration_seconds', 'Generation duration')
 
 # Pydantic models
 class GenerationRequest(BaseModel):
     """Request model for business card generation"""
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True, frozen=True)
+    
     concept: str = Field(default="Clinical-Precision", description="Design concept")
     side: str = Field(default="front", description="Card side (front/back)")
     quality: str = Field(default="production", description="Quality level")
@@ -73,6 +93,8 @@ class GenerationRequest(BaseModel):
 
 class BatchGenerationRequest(BaseModel):
     """Request model for batch generation"""
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True, frozen=True)
+    
     concepts: List[str] = Field(default=["Clinical-Precision"], description="Design concepts")
     sides: List[str] = Field(default=["front", "back"], description="Card sides")
     quality: str = Field(default="production", description="Quality level")
@@ -83,11 +105,25 @@ class JobStatus(BaseModel):
     job_id: str
     status: str
     progress: float
-    created_at: datetime
-    updated_at: datetime
+    created_at: float
+    updated_at: float
+    type: Optional[str] = None
     result_url: Optional[str] = None
     error_message: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
+    results: Optional[List[Dict[str, Any]]] = None
+    
+    @field_serializer("created_at", "updated_at")
+    def serialize_timestamp(self, value: float) -> str:
+        """Jobs store epoch seconds; format as ISO only on the way out"""
+        return datetime.fromtimestamp(value).isoformat()
+
+class JobList(BaseModel):
+    """Paginated job list response model"""
+    jobs: List[JobStatus]
+    total: int
+    limit: int
+    offset: int
 
 class HealthResponse(BaseModel):
     """Health check response model"""
@@ -97,56 +133,75 @@ class HealthResponse(BaseModel):
     services: Dict[str, str]
     metrics: Dict[str, Any]
 
-# Global variables
-app_state = {
-    "workflow": None,
-    "cache": None,
-    "batch_processor": None,
-    "metrics": None,
-    "jobs": {},
-    "redis": None
-}
+# Generated cards live here; behind nginx, downloads are handed off with
+# X-Accel-Redirect to an internal location mapped onto this directory
+OUTPUT_DIR = Path("output").resolve()
+X_ACCEL_REDIRECT_PREFIX = os.getenv("X_ACCEL_REDIRECT_PREFIX")
+
+# How long /health waits for a Celery worker to answer a ping
+WORKER_PING_TIMEOUT_SECONDS = 1.0
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
-    logger.info("Starting Business Card Generator v4.0")
-    
-    # Initialize services
+    # Started per worker process: a listener thread does not survive a fork.
+    # Records logged earlier wait in the queue and are written once it runs.
+    log_listener.start()
     try:
-        # Initialize workflow engine
-        app_state["workflow"] = ModernHybridWorkflow()
-        logger.info("Workflow engine initialized")
+        logger.info("Starting Business Card Generator v4.0")
         
-        # Initialize Redis connection
-        redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379')
-        app_state["redis"] = redis.from_url(redis_url, decode_responses=True)
-        logger.info("Redis connection established", redis_url=redis_url)
+        # Compress static assets once instead of on every response
+        try:
+            precompress_directory("static")
+        except OSError as e:
+            logger.warning("Static asset precompression failed", error=str(e))
         
-        # Initialize cache
-        app_state["cache"] = GenerationCache(app_state["redis"])
-        logger.info("Generation cache initialized")
-        
-        # Initialize batch processor
-        app_state["batch_processor"] = BatchProcessor(app_state["workflow"])
-        logger.info("Batch processor initialized")
-        
-        # Initialize metrics collector
-        app_state["metrics"] = MetricsCollector()
-        logger.info("Metrics collector initialized")
+        # Initialize services
+        try:
+            # Initialize Redis connection
+            redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379')
+            app.state.redis = aioredis.from_url(
+                redis_url,
+                decode_responses=True,
+                max_connections=int(os.getenv('REDIS_MAX_CONNECTIONS', '64'))
+            )
+            logger.info("Redis connection established", redis_url=redis_url)
+            
+            # Initialize job store (shared across workers via Redis)
+            app.state.job_store = JobStore(app.state.redis)
+            await app.state.job_store.load_scripts()
+            logger.info("Job store initialized", update_script=app.state.job_store.update_sha)
+            
+            # Initialize cache
+            app.state.cache = GenerationCache(app.state.redis)
+            logger.info("Generation cache initialized")
+            
+            # Initialize metrics collector
+            app.state.metrics = MetricsCollector()
+            logger.info("Metrics collector initialized")
+            
+            # Pre-render the web interface; it only depends on constants
+            app.state.index_html = templates.get_template("index.html").render(
+                title="Business Card Generator",
+                version="4.0.0",
+                static_url=static_files.versioned_url
+            )
+            app.state.index_etag = '"%s"' % hashlib.sha256(app.state.index_html.encode()).hexdigest()
+            
+            logger.info("All services initialized successfully")
+            
+        except Exception as e:
+            logger.error("Failed to initialize services", error=str(e))
+            raise
         
-        logger.info("All services initialized successfully")
+        yield
         
-    except Exception as e:
-        logger.error("Failed to initialize services", error=str(e))
-        raise
-    
-    yield
-    
-    # Cleanup
-    logger.info("Shutting down Business Card Generator v4.0")
-    if app_state["redis"]:
-        app_state["redis"].close()
+        # Cleanup
+        logger.info("Shutting down Business Card Generator v4.0")
+        await app.state.redis.aclose()
+    finally:
+        # Flush queued records even when startup fails
+        log_listener.stop()
 
 # Create FastAPI app
 app = FastAPI(
@@ -164,8 +219,15 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Compresses dynamic responses; static assets are served precompressed
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
+# HTTP request metrics, exposed on /metrics
+Instrumentator(
+    excluded_handlers=["/metrics", "/health"],
+    should_group_status_codes=True
+).instrument(app).expose(app, include_in_schema=False)
+
 # Security (optional JWT bearer token)
 security = HTTPBearer(auto_error=False)
 
@@ -178,58 +240,66 @@ async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(secur
     # For now, accept any bearer token for demonstration
     return {"user_id": "demo_user"}
 
+# Service dependencies (created in lifespan, stored on app.state)
+def get_redis(request: Request) -> aioredis.Redis:
+    """Shared async Redis client"""
+    return request.app.state.redis
+
+def get_job_store(request: Request) -> JobStore:
+    """Redis-backed job store"""
+    return request.app.state.job_store
+
+def get_cache(request: Request) -> GenerationCache:
+    """Generation result cache"""
+    return request.app.state.cache
+
+def get_metrics(request: Request) -> MetricsCollector:
+    """Metrics collector"""
+    return request.app.state.metrics
+
 # Static files and templates
-app.mount("/static", StaticFiles(directory="static"), name="static")
+static_files = PrecompressedStaticFiles(directory="static")
+app.mount("/static", static_files, name="static")
 templates = Jinja2Templates(directory="templates")
 
-# Request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all requests with metrics"""
-    start_time = time.time()
-    
-    response = await call_next(request)
-    
-    process_time = time.time() - start_time
-    REQUESTS.labels(method=request.method, endpoint=request.url.path).inc()
-    REQUEST_DURATION.observe(process_time)
-    
-    logger.info(
-        "Request processed",
-        method=request.method,
-        url=str(request.url),
-        status_code=response.status_code,
-        process_time=process_time
-    )
-    
-    return response
-
 # Root endpoint - serve web interface
 @app.get("/", response_class=HTMLResponse)
 async def web_interface(request: Request):
     """Serve the main web interface"""
-    return templates.TemplateResponse(
-        "index.html", 
-        {
-            "request": request,
-            "title": "Business Card Generator",
-            "version": "4.0.0"
-        }
+    etag = request.app.state.index_etag
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    return HTMLResponse(
+        request.app.state.index_html,
+        headers={"ETag": etag, "Cache-Control": "public, max-age=60"}
     )
 
 # Health check endpoint
 @app.get("/health", response_model=HealthResponse)
-async def health_check():
+async def health_check(
+    redis_client: aioredis.Redis = Depends(get_redis),
+    cache: GenerationCache = Depends(get_cache),
+    metrics_collector: MetricsCollector = Depends(get_metrics)
+):
     """Comprehensive health check"""
     try:
         # Test Redis connection
-        redis_status = "healthy" if app_state["redis"].ping() else "unhealthy"
+        redis_status = "healthy" if await redis_client.ping() else "unhealthy"
         
-        # Test workflow engine
-        workflow_status = "healthy" if app_state["workflow"] else "unhealthy"
+        # Generation runs on the Celery workers; the workflow is up if one answers
+        try:
+            replies = await asyncio.to_thread(
+                celery_app.control.ping, timeout=WORKER_PING_TIMEOUT_SECONDS
+            )
+            workflow_status = "healthy" if replies else "unhealthy"
+        except Exception as e:
+            await logger.awarning("Worker ping failed", error=str(e))
+            workflow_status = "unhealthy"
         
         # Collect metrics
-        metrics = app_state["metrics"].get_summary() if app_state["metrics"] else {}
+        metrics = metrics_collector.get_summary() if metrics_collector else {}
         
         return HealthResponse(
             status="healthy" if all([
@@ -241,27 +311,27 @@ async def health_check():
             services={
                 "redis": redis_status,
                 "workflow": workflow_status,
-                "cache": "healthy" if app_state["cache"] else "unhealthy",
-                "batch_processor": "healthy" if app_state["batch_processor"] else "unhealthy"
+                "cache": "healthy" if cache else "unhealthy"
             },
             metrics=metrics
         )
         
     except Exception as e:
-        logger.error("Health check failed", error=str(e))
+        await logger.aerror("Health check failed", error=str(e))
         raise HTTPException(status_code=503, detail="Service unhealthy")
 
 # Generate single business card
 @app.post("/api/generate")
 async def generate_card(
     request: GenerationRequest,
-    background_tasks: BackgroundTasks,
-    user: Optional[Dict] = Depends(verify_token)
+    user: Optional[Dict] = Depends(verify_token),
+    job_store: JobStore = Depends(get_job_store)
 ):
     """Generate a single business card"""
-    job_id = str(uuid.uuid4())
+    # ULIDs sort by creation time, so job ids and logs order chronologically
+    job_id = str(ULID())
     
-    logger.info(
+    await logger.ainfo(
         "Generation request received",
         job_id=job_id,
         concept=request.concept,
@@ -275,23 +345,23 @@ async def generate_card(
     GENERATION_REQUESTS.labels(model=model_name, concept=request.concept).inc()
     
     # Create job entry
+    now = time.time()
     job = {
         "id": job_id,
         "status": "queued",
         "progress": 0.0,
-        "created_at": datetime.now(),
-        "updated_at": datetime.now(),
-        "request": request.dict(),
+        "created_at": now,
+        "updated_at": now,
+        "request": request.model_dump(mode="json"),
         "user_id": user.get("user_id") if user else None
     }
     
-    app_state["jobs"][job_id] = job
+    await job_store.create(job)
     
-    # Queue background task
-    background_tasks.add_task(
-        process_generation_job, 
-        job_id, 
-        request
+    # Queue job for the Celery workers; publishing is a blocking broker
+    # round trip, so keep it off the event loop
+    await asyncio.to_thread(
+        celery_app.send_task, "jobs.process_generation_job", args=[job_id, request.model_dump()]
     )
     
     return {
@@ -304,13 +374,14 @@ async def generate_card(
 @app.post("/api/generate/batch")
 async def generate_batch(
     request: BatchGenerationRequest,
-    background_tasks: BackgroundTasks,
-    user: Optional[Dict] = Depends(verify_token)
+    user: Optional[Dict] = Depends(verify_token),
+    job_store: JobStore = Depends(get_job_store)
 ):
     """Generate multiple business cards in batch"""
-    job_id = str(uuid.uuid4())
+    # ULIDs sort by creation time, so job ids and logs order chronologically
+    job_id = str(ULID())
     
-    logger.info(
+    await logger.ainfo(
         "Batch generation request received",
         job_id=job_id,
         concepts=request.concepts,
@@ -320,24 +391,24 @@ async def generate_batch(
     )
     
     # Create job entry
+    now = time.time()
     job = {
         "id": job_id,
         "status": "queued",
         "progress": 0.0,
-        "created_at": datetime.now(),
-        "updated_at": datetime.now(),
-        "request": request.dict(),
+        "created_at": now,
+        "updated_at": now,
+        "request": request.model_dump(mode="json"),
         "user_id": user.get("user_id") if user else None,
         "type": "batch"
     }
     
-    app_state["jobs"][job_id] = job
+    await job_store.create(job)
     
-    # Queue background task
-    background_tasks.add_task(
-        process_batch_job,
-        job_id,
-        request
+    # Queue job for the Celery workers; publishing is a blocking broker
+    # round trip, so keep it off the event loop
+    await asyncio.to_thread(
+        celery_app.send_task, "jobs.process_batch_job", args=[job_id, request.model_dump()]
     )
     
     total_cards = len(request.concepts) * len(request.sides)
@@ -351,63 +422,50 @@ async def generate_batch(
 
 # Check job status
 @app.get("/api/jobs/{job_id}", response_model=JobStatus)
-async def get_job_status(job_id: str):
+async def get_job_status(job_id: str, job_store: JobStore = Depends(get_job_store)):
     """Get generation job status"""
-    if job_id not in app_state["jobs"]:
+    job = await job_store.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job = app_state["jobs"][job_id]
-    
-    return JobStatus(
-        job_id=job["id"],
-        status=job["status"],
-        progress=job["progress"],
-        created_at=job["created_at"],
-        updated_at=job["updated_at"],
-        result_url=job.get("result_url"),
-        error_message=job.get("error_message"),
-        metadata=job.get("metadata")
-    )
+    # Validate and serialize in the pydantic core, skipping response_model re-validation
+    status = JobStatus.model_validate({**job, "job_id": job["id"]})
+    return Response(content=status.model_dump_json(), media_type="application/json")
 
 # List user's jobs
-@app.get("/api/jobs")
+@app.get("/api/jobs", response_model=JobList)
 async def list_jobs(
-    limit: int = 10,
-    offset: int = 0,
-    user: Optional[Dict] = Depends(verify_token)
+    limit: int = Query(10, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    user: Optional[Dict] = Depends(verify_token),
+    job_store: JobStore = Depends(get_job_store)
 ):
     """List generation jobs for user"""
     user_id = user.get("user_id") if user else None
     
-    # Filter jobs by user (if authenticated)
-    jobs = [
-        job for job in app_state["jobs"].values()
-        if not user_id or job.get("user_id") == user_id
-    ]
-    
-    # Sort by creation time (newest first)
-    jobs = sorted(jobs, key=lambda x: x["created_at"], reverse=True)
-    
-    # Paginate
-    total = len(jobs)
-    jobs = jobs[offset:offset + limit]
+    # Newest first, filtered by user (if authenticated)
+    jobs, total = await job_store.list_jobs(
+        user_id=user_id,
+        limit=limit,
+        offset=offset
+    )
     
-    return {
-        "jobs": jobs,
+    job_list = JobList.model_validate({
+        "jobs": [{**job, "job_id": job["id"]} for job in jobs],
         "total": total,
         "limit": limit,
         "offset": offset
-    }
+    })
+    return Response(content=job_list.model_dump_json(), media_type="application/json")
 
 # Download generated file
 @app.get("/api/download/{job_id}")
-async def download_file(job_id: str):
+async def download_file(job_id: str, job_store: JobStore = Depends(get_job_store)):
     """Download generated business card file"""
-    if job_id not in app_state["jobs"]:
+    job = await job_store.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job = app_state["jobs"][job_id]
-    
     if job["status"] != "completed":
         raise HTTPException(status_code=400, detail="Job not completed")
     
@@ -418,167 +476,27 @@ async def download_file(job_id: str):
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="File not found")
     
+    if X_ACCEL_REDIRECT_PREFIX:
+        try:
+            relative_path = file_path.resolve().relative_to(OUTPUT_DIR)
+        except ValueError:
+            raise HTTPException(status_code=404, detail="File not found")
+        
+        # Let nginx send the file; the worker only returns headers
+        return Response(
+            media_type="image/png",
+            headers={
+                "X-Accel-Redirect": f"{X_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{relative_path.as_posix()}",
+                "Content-Disposition": f'attachment; filename="{file_path.name}"'
+            }
+        )
+    
     return FileResponse(
         path=file_path,
         filename=file_path.name,
         media_type="image/png"
     )
 
-# Prometheus metrics endpoint
-@app.get("/metrics")
-async def metrics():
-    """Prometheus metrics endpoint"""
-    return generate_latest()
-
-# Background task functions
-async def process_generation_job(job_id: str, request: GenerationRequest):
-    """Process single generation job"""
-    start_time = time.time()
-    
-    try:
-        # Update job status
-        job = app_state["jobs"][job_id]
-        job["status"] = "processing"
-        job["progress"] = 10.0
-        job["updated_at"] = datetime.now()
-        
-        logger.info("Starting generation", job_id=job_id)
-        
-        # Check cache first
-        cache_key = f"{request.concept}:{request.side}:{request.quality}:{request.model}"
-        cached_result = app_state["cache"].get_cached(cache_key)
-        
-        if cached_result:
-            logger.info("Using cached result", job_id=job_id, cache_key=cache_key)
-            job["result_url"] = cached_result.filepath
-            job["status"] = "completed"
-            job["progress"] = 100.0
-            job["updated_at"] = datetime.now()
-            return
-        
-        # Update progress
-        job["progress"] = 30.0
-        job["updated_at"] = datetime.now()
-        
-        # Determine model
-        model = ModelType.AUTO
-        if request.model:
-            model = ModelType(request.model)
-        
-        # Generate card
-        result = app_state["workflow"].generate_card(
-            concept=request.concept,
-            side=request.side,
-            model=model,
-            quality=request.quality
-        )
-        
-        # Update progress
-        job["progress"] = 80.0
-        job["updated_at"] = datetime.now()
-        
-        if result.success:
-            # Cache result
-            app_state["cache"].cache_result(cache_key, result)
-            
-            # Update job
-            job["status"] = "completed"
-            job["progress"] = 100.0
-            job["result_url"] = result.filepath
-            job["metadata"] = {
-                "model_used": result.model_used,
-                "cost_estimate": result.cost_estimate,
-                "processing_time": result.processing_time
-            }
-            
-            logger.info(
-                "Generation completed successfully",
-                job_id=job_id,
-                filepath=result.filepath,
-                model=result.model_used,
-                processing_time=result.processing_time
-            )
-            
-        else:
-            job["status"] = "failed"
-            job["error_message"] = result.error_message
-            
-            logger.error(
-                "Generation failed",
-                job_id=job_id,
-                error=result.error_message
-            )
-        
-        job["updated_at"] = datetime.now()
-        
-        # Record metrics
-        duration = time.time() - start_time
-        GENERATION_DURATION.observe(duration)
-        
-    except Exception as e:
-        logger.error("Job processing failed", job_id=job_id, error=str(e))
-        
-        job = app_state["jobs"][job_id]
-        job["status"] = "failed"
-        job["error_message"] = str(e)
-        job["updated_at"] = datetime.now()
-
-async def process_batch_job(job_id: str, request: BatchGenerationRequest):
-    """Process batch generation job"""
-    try:
-        # Update job status
-        job = app_state["jobs"][job_id]
-        job["status"] = "processing"
-        job["progress"] = 0.0
-        job["updated_at"] = datetime.now()
-        
-        logger.info("Starting batch generation", job_id=job_id)
-        
-        # Use batch processor
-        results = await app_state["batch_processor"].process_batch(
-            concepts=request.concepts,
-            sides=request.sides,
-            quality=request.quality,
-            model=request.model,
-            progress_callback=lambda p: update_job_progress(job_id, p)
-        )
-        
-        # Update job with results
-        job["status"] = "completed"
-        job["progress"] = 100.0
-        job["results"] = [
-            {
-                "concept": r.concept,
-                "side": r.side,
-                "success": r.success,
-                "filepath": r.filepath,
-                "error": r.error_message
-            }
-            for r in results
-        ]
-        job["updated_at"] = datetime.now()
-        
-        logger.info(
-            "Batch generation completed",
-            job_id=job_id,
-            total_results=len(results),
-            successful=sum(1 for r in results if r.success)
-        )
-        
-    except Exception as e:
-        logger.error("Batch job processing failed", job_id=job_id, error=str(e))
-        
-        job = app_state["jobs"][job_id]
-        job["status"] = "failed"
-        job["error_message"] = str(e)
-        job["updated_at"] = datetime.now()
-
-def update_job_progress(job_id: str, progress: float):
-    """Update job progress"""
-    if job_id in app_state["jobs"]:
-        app_state["jobs"][job_id]["progress"] = progress
-        app_state["jobs"][job_id]["updated_at"] = datetime.now()
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -12,9 +12,14 @@ This version:
 
 import sys
 import os
+import argparse
+import hashlib
+import json
+import logging
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 
 # Add src to path
@@ -22,18 +27,80 @@ sys.path.append('src')
 
 try:
     from hybrid.modern_workflow import ModernHybridWorkflow, ModelType, GenerationResult
-    from display.image_viewer import ImageViewer
+    from display.image_viewer import ImageViewer, IncrementalDisplay
     from assets.real_asset_manager import RealAssetManager
 except ImportError as e:
     print(f"❌ Import failed: {e}")
     print("Run from project root: python enhanced_iterative_workflow.py")
     sys.exit(1)
 
+# Phase output goes through logging, which writes each line whole under the
+# handler's lock and in order with the viewer prompts. ModernHybridWorkflow
+# still prints its own progress lines, so while options generate concurrently
+# those can interleave with each other and with these.
+logger = logging.getLogger("enhanced_workflow")
+if not logger.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+# Results of earlier runs, keyed by SHA-256 of (prompt, model, quality)
+PROMPT_CACHE_DIR = Path("cache/prompts")
+
+# Appended to every enhanced prompt; formatted once with the brand colors
+UNIVERSAL_REQUIREMENTS_TEMPLATE = """**UNIVERSAL ENHANCEMENT REQUIREMENTS**:
+- Output format: Flat 2D business card design (NO 3D mockups, NO shadows, NO perspective)
+- Dimensions: 3.5" × 2.0" business card proportions
+- Quality: Vector-style clean design, commercial print ready
+- Brand Colors: EXACT hex values - {obsidian}, {emerald}, {white}
+- Asset Integration: Seamlessly incorporate "A Stronger Life" branding elements
+- Design Evolution: Build upon previous design learnings and improvements
+- Style: "Equinox meets Mayo Clinic" - Premium medical luxury aesthetic
+- Professional: High-end rehabilitation practice, trustworthy, sophisticated
+
+**ASSET INTEGRATION MANDATE**: Use actual brand identity elements, not generic substitutes.
+**EVOLUTION MANDATE**: Improve upon previous designs, don't start from scratch.
+"""
+
 class EnhancedIterativeWorkflow:
     """Enhanced iterative workflow with REAL asset integration"""
     
-    def __init__(self):
-        """Initialize the enhanced iterative workflow"""
+    # The four options of a phase are independent API calls - run them together
+    MAX_CONCURRENT_GENERATIONS = 4
+    
+    # Options offered in phases 1-3; the summary shows the name before " - "
+    CONCEPT_OPTIONS: Dict[str, str] = {
+        'A': 'Clinical Precision (Enhanced) - Refined medical authority',
+        'B': 'Athletic Performance (Enhanced) - Amplified energy and strength', 
+        'C': 'Luxury Wellness (Enhanced) - Elevated premium spa aesthetic',
+        'D': 'Minimalist Modern (Enhanced) - Perfected architectural simplicity'
+    }
+    
+    LAYOUT_OPTIONS: Dict[str, str] = {
+        '1': 'Centered Symmetrical - Medical chart precision with logo focus',
+        '2': 'Left-Aligned Traditional - Classic hierarchy with asset integration',
+        '3': 'Dynamic Asymmetric - Energy flow optimized for logo placement',
+        '4': 'Minimal Corner Accent - Architectural balance with brand elements'
+    }
+    
+    TYPOGRAPHY_OPTIONS: Dict[str, str] = {
+        'a': 'Bold Condensed (Enhanced) - Professional impact with asset harmony',
+        'b': 'Light Extended (Enhanced) - Elegant spacing optimized for logo',
+        'c': 'Medium Rounded (Enhanced) - Modern friendliness with brand consistency', 
+        'd': 'Serif Classic (Enhanced) - Timeless authority with asset integration'
+    }
+    
+    def __init__(self, batch_mode: bool = False, use_cache: bool = True):
+        """
+        Initialize the enhanced iterative workflow
+        
+        Args:
+            batch_mode: Send the Gemini review phases (2 and 3) as one batch-mode
+                job each - half the cost, but results arrive when the job finishes
+            use_cache: Reuse images from earlier runs for identical prompts
+        """
         print("🚀 ENHANCED BUSINESS CARD GENERATOR v4.1")
         print("=" * 80)
         print("NOW WITH REAL ASSET INTEGRATION AND DESIGN EVOLUTION")
@@ -47,6 +114,18 @@ class EnhancedIterativeWorkflow:
             self.viewer = ImageViewer()
             self.assets = RealAssetManager()  # Now uses the enhanced asset manager
             
+            # Prompt text that depends only on the assets loaded above - build it once
+            self.concept_prompts = self.assets.create_enhanced_concept_prompts()
+            self.universal_requirements = UNIVERSAL_REQUIREMENTS_TEMPLATE.format(
+                obsidian=self.assets.brand_colors['deep_obsidian_black'],
+                emerald=self.assets.brand_colors['emerald_glow'],
+                white=self.assets.brand_colors['arctic_white']
+            )
+            
+            self.batch_mode = batch_mode
+            self.use_cache = use_cache
+            self.cache_dir = PROMPT_CACHE_DIR
+            
             # Session tracking
             self.session_history = []
             self.total_cost = 0.0
@@ -58,8 +137,10 @@ class EnhancedIterativeWorkflow:
             print("✅ All systems initialized with real asset integration")
             print(f"   • OpenAI GPT Image 1: {'✅' if self.workflow.openai_available else '❌'}")
             print(f"   • Google Gemini: {'✅' if self.workflow.gemini_available else '❌'}")
-            print(f"   • Logo Assets: {len([k for k in self.assets.assets.keys() if 'logo' in k])} logo files processed")
+            print(f"   • Logo Assets: {self.assets.logo_count} logo files processed")
             print(f"   • Previous Cards: {len(self.assets.previous_cards)} cards found as reference")
+            print(f"   • Gemini Batch Mode: {'✅' if self.batch_mode else '❌'}")
+            print(f"   • Prompt Cache: {'✅' if self.use_cache else '❌'}")
             
         except Exception as e:
             print(f"❌ Failed to initialize: {e}")
@@ -99,103 +180,74 @@ class EnhancedIterativeWorkflow:
     
     def phase_1_enhanced_concept_generation(self) -> str:
         """Phase 1: Generate 4 enhanced concepts using real assets and previous work"""
-        print("🎯 PHASE 1: ENHANCED CONCEPT GENERATION")
-        print("=" * 60)
-        print("Using GPT Image 1 with:")
-        print("• Real logo file analysis and integration")
-        print("• Previous business card design evolution")
-        print("• Brand asset-informed creativity")
-        print("Generating 4 evolved design concepts...\n")
-        
-        # Get enhanced concept prompts with real asset integration
-        concept_prompts = self.assets.create_enhanced_concept_prompts()
-        
-        concept_options = {
-            'A': 'Clinical Precision (Enhanced) - Refined medical authority',
-            'B': 'Athletic Performance (Enhanced) - Amplified energy and strength', 
-            'C': 'Luxury Wellness (Enhanced) - Elevated premium spa aesthetic',
-            'D': 'Minimalist Modern (Enhanced) - Perfected architectural simplicity'
-        }
-        
-        generated_images = []
+        logger.info("🎯 PHASE 1: ENHANCED CONCEPT GENERATION")
+        logger.info("=" * 60)
+        logger.info("Using GPT Image 1 with:")
+        logger.info("• Real logo file analysis and integration")
+        logger.info("• Previous business card design evolution")
+        logger.info("• Brand asset-informed creativity")
+        logger.info("Generating 4 evolved design concepts...\n")
         
         # Show what assets are being used
-        print("📋 ASSET INTEGRATION STATUS:")
+        logger.info("📋 ASSET INTEGRATION STATUS:")
         logo_file = self.assets.get_logo_file_path()
         if logo_file:
-            print(f"   • Logo File: {Path(logo_file).name}")
-        print(f"   • Previous Cards: {len(self.assets.previous_cards)} designs for reference")
+            logger.info(f"   • Logo File: {Path(logo_file).name}")
+        logger.info(f"   • Previous Cards: {len(self.assets.previous_cards)} designs for reference")
         if self.assets.previous_cards:
             for card in self.assets.previous_cards:
-                print(f"     → {card['filename']} - {card['description']}")
-        print()
+                logger.info(f"     → {card['filename']} - {card['description']}")
+        logger.info("")
         
-        # Generate each enhanced concept
-        for key, description in concept_options.items():
-            print(f"🎨 Generating Enhanced Concept {key}: {description}")
+        # Generate all enhanced concepts concurrently
+        jobs = {}
+        for key, description in self.CONCEPT_OPTIONS.items():
+            logger.info(f"🎨 Generating Enhanced Concept {key}: {description}")
             
             # Use the enhanced concept prompt with real asset integration
-            result = self._generate_with_enhanced_prompt(
-                concept_prompts[key],
+            jobs[key] = (
+                self.concept_prompts[key],
                 f"Enhanced-Concept-{key}",
                 ModelType.GPT_IMAGE_1,  # High creativity for concepts
                 'production'
             )
-            
-            if result.success:
-                generated_images.append(result.filepath)
-                self.session_history.append(f"Enhanced Concept {key}: {result.filepath}")
-                self.total_cost += result.cost_estimate
-                print(f"✅ Enhanced Concept {key} complete: {Path(result.filepath).name}")
-            else:
-                print(f"❌ Enhanced Concept {key} failed: {result.error_message}")
-            
-            print()  # Spacing between concepts
+        logger.info("")
+        
+        # Open each image as soon as it is ready instead of after the slowest one
+        display = self.viewer.display_incremental(self.CONCEPT_OPTIONS)
+        generated_images = self._generate_variants(jobs, "Enhanced Concept", display)
         
         if not generated_images:
             raise Exception("No enhanced concepts were generated successfully")
         
         # Show images and get user selection
-        print("🔍 ENHANCED REVIEW PHASE: All concepts generated with real asset integration!")
-        print("Each concept builds upon previous work and uses your actual logo files.")
-        print("Opening images in your default viewer...\n")
+        logger.info("🔍 ENHANCED REVIEW PHASE: All concepts generated with real asset integration!")
+        logger.info("Each concept builds upon previous work and uses your actual logo files.")
+        logger.info("Review the opened images...\n")
         
-        selected_key, selected_image = self.viewer.display_and_select(
-            generated_images, 
-            concept_options
-        )
+        selected_key, selected_image = display.finalize_and_select()
         
-        print(f"\n🎉 ENHANCED CONCEPT SELECTED: {selected_key} - {concept_options[selected_key]}")
+        logger.info(f"\n🎉 ENHANCED CONCEPT SELECTED: {selected_key} - {self.CONCEPT_OPTIONS[selected_key]}")
         
         return selected_key
     
     def phase_2_layout_refinement(self) -> str:
         """Phase 2: Generate 4 layout variations building on selected enhanced concept"""
-        print(f"\n🎯 PHASE 2: LAYOUT REFINEMENT (Building on Enhanced Concept)")
-        print("=" * 70)
-        print(f"Refining layouts for: Enhanced Concept {self.selected_concept}")
-        print("Using Gemini with logo integration and previous design learnings...\n")
-        
-        layout_options = {
-            '1': 'Centered Symmetrical - Medical chart precision with logo focus',
-            '2': 'Left-Aligned Traditional - Classic hierarchy with asset integration',
-            '3': 'Dynamic Asymmetric - Energy flow optimized for logo placement',
-            '4': 'Minimal Corner Accent - Architectural balance with brand elements'
-        }
+        logger.info(f"\n🎯 PHASE 2: LAYOUT REFINEMENT (Building on Enhanced Concept)")
+        logger.info("=" * 70)
+        logger.info(f"Refining layouts for: Enhanced Concept {self.selected_concept}")
+        logger.info("Using Gemini with logo integration and previous design learnings...\n")
         
         # Build refined prompt based on selected enhanced concept
-        base_concept_prompt = self.assets.create_enhanced_concept_prompts()[self.selected_concept]
-        
-        generated_images = []
+        base_concept_prompt = self.concept_prompts[self.selected_concept]
         
-        # Generate each layout variation
-        for key, description in layout_options.items():
-            print(f"🎨 Generating Enhanced Layout {key}: {description}")
+        # Generate all layout variations concurrently
+        jobs = {}
+        for key, description in self.LAYOUT_OPTIONS.items():
+            logger.info(f"🎨 Generating Enhanced Layout {key}: {description}")
             
             # Create layout-specific prompt that builds on the enhanced concept
             layout_prompt = f"""
-{base_concept_prompt}
-
 **ENHANCED LAYOUT REFINEMENT**:
 {description}
 
@@ -212,66 +264,50 @@ class EnhancedIterativeWorkflow:
 **OUTPUT**: Business card front with enhanced layout variation {key} building on Concept {self.selected_concept}
 """
             
-            result = self._generate_with_enhanced_prompt(
+            jobs[key] = (
                 layout_prompt,
                 f"Enhanced-Layout-{self.selected_concept}-{key}",
                 ModelType.GEMINI_FLASH,  # Fast iteration
                 'review'
             )
-            
-            if result.success:
-                generated_images.append(result.filepath)
-                self.session_history.append(f"Enhanced Layout {key}: {result.filepath}")
-                self.total_cost += result.cost_estimate
-                print(f"✅ Enhanced Layout {key} complete: {Path(result.filepath).name}")
-            else:
-                print(f"❌ Enhanced Layout {key} failed: {result.error_message}")
-            
-            print()
+        logger.info("")
+        
+        # Open each image as soon as it is ready instead of after the slowest one
+        display = self.viewer.display_incremental(self.LAYOUT_OPTIONS)
+        generated_images = self._generate_variants(
+            jobs, "Enhanced Layout", display, shared_prompt=f"\n{base_concept_prompt}\n"
+        )
         
         if not generated_images:
             raise Exception("No enhanced layout variations were generated successfully")
         
         # Show images and get user selection
-        print("🔍 ENHANCED REVIEW PHASE: All layout variations with asset integration!")
-        print("Each layout builds on your selected concept and integrates real brand assets.")
-        print("Compare layouts and choose your preferred structure...\n")
+        logger.info("🔍 ENHANCED REVIEW PHASE: All layout variations with asset integration!")
+        logger.info("Each layout builds on your selected concept and integrates real brand assets.")
+        logger.info("Compare layouts and choose your preferred structure...\n")
         
-        selected_key, selected_image = self.viewer.display_and_select(
-            generated_images,
-            layout_options
-        )
+        selected_key, selected_image = display.finalize_and_select()
         
-        print(f"\n🎉 ENHANCED LAYOUT SELECTED: {selected_key} - {layout_options[selected_key]}")
+        logger.info(f"\n🎉 ENHANCED LAYOUT SELECTED: {selected_key} - {self.LAYOUT_OPTIONS[selected_key]}")
         
         return selected_key
     
     def phase_3_typography_treatment(self) -> str:
         """Phase 3: Generate 4 typography treatments with enhanced design continuity"""
-        print(f"\n🎯 PHASE 3: ENHANCED TYPOGRAPHY TREATMENT")
-        print("=" * 70)
-        print(f"Perfecting typography for: Enhanced Concept {self.selected_concept} + Layout {self.selected_layout}")
-        print("Maintaining all asset integrations and design improvements...\n")
-        
-        typography_options = {
-            'a': 'Bold Condensed (Enhanced) - Professional impact with asset harmony',
-            'b': 'Light Extended (Enhanced) - Elegant spacing optimized for logo',
-            'c': 'Medium Rounded (Enhanced) - Modern friendliness with brand consistency', 
-            'd': 'Serif Classic (Enhanced) - Timeless authority with asset integration'
-        }
+        logger.info(f"\n🎯 PHASE 3: ENHANCED TYPOGRAPHY TREATMENT")
+        logger.info("=" * 70)
+        logger.info(f"Perfecting typography for: Enhanced Concept {self.selected_concept} + Layout {self.selected_layout}")
+        logger.info("Maintaining all asset integrations and design improvements...\n")
         
         # Build typography-focused prompt maintaining all previous enhancements
-        base_concept_prompt = self.assets.create_enhanced_concept_prompts()[self.selected_concept]
-        
-        generated_images = []
+        base_concept_prompt = self.concept_prompts[self.selected_concept]
         
-        # Generate each enhanced typography variation
-        for key, description in typography_options.items():
-            print(f"🎨 Generating Enhanced Typography {key}: {description}")
+        # Generate all enhanced typography variations concurrently
+        jobs = {}
+        for key, description in self.TYPOGRAPHY_OPTIONS.items():
+            logger.info(f"🎨 Generating Enhanced Typography {key}: {description}")
             
             typography_prompt = f"""
-{base_concept_prompt}
-
 **ENHANCED TYPOGRAPHY TREATMENT**:
 Selected Enhanced Path: Concept {self.selected_concept} → Layout {self.selected_layout}
 Typography Enhancement: {description}
@@ -290,54 +326,47 @@ Typography Enhancement: {description}
 **OUTPUT**: Business card front with enhanced typography treatment {key} building on all previous selections
 """
             
-            result = self._generate_with_enhanced_prompt(
+            jobs[key] = (
                 typography_prompt,
                 f"Enhanced-Typography-{self.selected_concept}-{self.selected_layout}-{key}",
                 ModelType.GEMINI_FLASH,  # Fast iteration
                 'review'
             )
-            
-            if result.success:
-                generated_images.append(result.filepath)
-                self.session_history.append(f"Enhanced Typography {key}: {result.filepath}")
-                self.total_cost += result.cost_estimate
-                print(f"✅ Enhanced Typography {key} complete: {Path(result.filepath).name}")
-            else:
-                print(f"❌ Enhanced Typography {key} failed: {result.error_message}")
-            
-            print()
+        logger.info("")
+        
+        # Open each image as soon as it is ready instead of after the slowest one
+        display = self.viewer.display_incremental(self.TYPOGRAPHY_OPTIONS)
+        generated_images = self._generate_variants(
+            jobs, "Enhanced Typography", display, shared_prompt=f"\n{base_concept_prompt}\n"
+        )
         
         if not generated_images:
             raise Exception("No enhanced typography variations were generated successfully")
         
         # Show images and get user selection
-        print("🔍 ENHANCED REVIEW PHASE: All typography treatments with full asset integration!")
-        print("Each treatment maintains concept and layout enhancements while perfecting text.")
-        print("Compare text treatments and choose your favorite...\n")
+        logger.info("🔍 ENHANCED REVIEW PHASE: All typography treatments with full asset integration!")
+        logger.info("Each treatment maintains concept and layout enhancements while perfecting text.")
+        logger.info("Compare text treatments and choose your favorite...\n")
         
-        selected_key, selected_image = self.viewer.display_and_select(
-            generated_images,
-            typography_options
-        )
+        selected_key, selected_image = display.finalize_and_select()
         
-        print(f"\n🎉 ENHANCED TYPOGRAPHY SELECTED: {selected_key} - {typography_options[selected_key]}")
+        logger.info(f"\n🎉 ENHANCED TYPOGRAPHY SELECTED: {selected_key} - {self.TYPOGRAPHY_OPTIONS[selected_key]}")
         
         return selected_key
     
     def phase_4_final_production(self):
         """Phase 4: Generate final production cards with full enhancement chain"""
-        print(f"\n🎯 PHASE 4: ENHANCED FINAL PRODUCTION")
-        print("=" * 70)
-        print("Generating production-ready business cards with:")
-        print(f"• Enhanced Concept {self.selected_concept}")
-        print(f"• Enhanced Layout {self.selected_layout}")
-        print(f"• Enhanced Typography {self.selected_typography}")
-        print("• Full asset integration and design evolution")
-        print(f"Enhanced Design Code: {self.selected_concept}-{self.selected_layout}-{self.selected_typography}\n")
+        logger.info(f"\n🎯 PHASE 4: ENHANCED FINAL PRODUCTION")
+        logger.info("=" * 70)
+        logger.info("Generating production-ready business cards with:")
+        logger.info(f"• Enhanced Concept {self.selected_concept}")
+        logger.info(f"• Enhanced Layout {self.selected_layout}")
+        logger.info(f"• Enhanced Typography {self.selected_typography}")
+        logger.info("• Full asset integration and design evolution")
+        logger.info(f"Enhanced Design Code: {self.selected_concept}-{self.selected_layout}-{self.selected_typography}\n")
         
         # Create final production prompt with all enhancements
-        concept_prompts = self.assets.create_enhanced_concept_prompts()
-        base_concept = concept_prompts[self.selected_concept]
+        base_concept = self.concept_prompts[self.selected_concept]
         
         final_prompt = f"""
 {base_concept}
@@ -367,7 +396,7 @@ Maximum quality combining real assets with iterative refinement.
 """
         
         # Generate enhanced front card
-        print("🖼️  Generating ENHANCED FINAL FRONT card...")
+        logger.info("🖼️  Generating ENHANCED FINAL FRONT card...")
         front_result = self._generate_with_enhanced_prompt(
             final_prompt + "\n**CARD SIDE**: Front card with complete contact information and asset integration",
             f"ENHANCED-FINAL-{self.selected_concept}-{self.selected_layout}-{self.selected_typography}-FRONT",
@@ -376,14 +405,14 @@ Maximum quality combining real assets with iterative refinement.
         )
         
         if front_result.success:
-            print(f"✅ ENHANCED FINAL FRONT: {Path(front_result.filepath).name}")
+            logger.info(f"✅ ENHANCED FINAL FRONT: {Path(front_result.filepath).name}")
             self.session_history.append(f"Enhanced Final Front: {front_result.filepath}")
             self.total_cost += front_result.cost_estimate
         else:
-            print(f"❌ Enhanced final front failed: {front_result.error_message}")
+            logger.warning(f"❌ Enhanced final front failed: {front_result.error_message}")
         
         # Generate enhanced back card
-        print("🖼️  Generating ENHANCED FINAL BACK card...")
+        logger.info("🖼️  Generating ENHANCED FINAL BACK card...")
         back_result = self._generate_with_enhanced_prompt(
             final_prompt + "\n**CARD SIDE**: Back card with 'Revolutionary Rehabilitation' tagline and asset integration",
             f"ENHANCED-FINAL-{self.selected_concept}-{self.selected_layout}-{self.selected_typography}-BACK",
@@ -392,16 +421,16 @@ Maximum quality combining real assets with iterative refinement.
         )
         
         if back_result.success:
-            print(f"✅ ENHANCED FINAL BACK: {Path(back_result.filepath).name}")
+            logger.info(f"✅ ENHANCED FINAL BACK: {Path(back_result.filepath).name}")
             self.session_history.append(f"Enhanced Final Back: {back_result.filepath}")
             self.total_cost += back_result.cost_estimate
         else:
-            print(f"❌ Enhanced final back failed: {back_result.error_message}")
+            logger.warning(f"❌ Enhanced final back failed: {back_result.error_message}")
         
         # Show enhanced final cards
         if front_result.success or back_result.success:
-            print(f"\n🎉 ENHANCED PRODUCTION COMPLETE!")
-            print("Opening final enhanced cards with full asset integration...")
+            logger.info(f"\n🎉 ENHANCED PRODUCTION COMPLETE!")
+            logger.info("Opening final enhanced cards with full asset integration...")
             
             final_cards = []
             if front_result.success:
@@ -410,36 +439,202 @@ Maximum quality combining real assets with iterative refinement.
                 final_cards.append(back_result.filepath)
             
             self.viewer.show_comparison_grid(final_cards, "ENHANCED FINAL PRODUCTION CARDS")
-            print("✅ Your enhanced business cards with real asset integration are ready!")
+            logger.info("✅ Your enhanced business cards with real asset integration are ready!")
     
-    def _generate_with_enhanced_prompt(self, prompt: str, filename_prefix: str, model: ModelType, quality: str) -> GenerationResult:
-        """Generate image with enhanced prompt including asset integration"""
+    def _generate_variants(
+        self,
+        jobs: Dict[str, Tuple[str, str, ModelType, str]],
+        label: str,
+        display: Optional[IncrementalDisplay] = None,
+        shared_prompt: str = ""
+    ) -> List[str]:
+        """
+        Generate the options of a phase concurrently and record the results
+        
+        Args:
+            jobs: Dict mapping option keys to (prompt, filename_prefix, model, quality)
+            label: Option label used in status messages and session history
+            display: Review display that each successful image is added to
+            shared_prompt: Prompt text preceding every job's own prompt
+            
+        Returns:
+            Filepaths of the successful options, in option key order
+        """
+        results: Dict[str, GenerationResult] = {}
         
-        # Add universal requirements with asset integration
-        universal_prompt = f"""
-{prompt}
-
-**UNIVERSAL ENHANCEMENT REQUIREMENTS**:
-- Output format: Flat 2D business card design (NO 3D mockups, NO shadows, NO perspective)
-- Dimensions: 3.5" × 2.0" business card proportions
-- Quality: Vector-style clean design, commercial print ready
-- Brand Colors: EXACT hex values - {self.assets.brand_colors['deep_obsidian_black']}, {self.assets.brand_colors['emerald_glow']}, {self.assets.brand_colors['arctic_white']}
-- Asset Integration: Seamlessly incorporate "A Stronger Life" branding elements
-- Design Evolution: Build upon previous design learnings and improvements
-- Style: "Equinox meets Mayo Clinic" - Premium medical luxury aesthetic
-- Professional: High-end rehabilitation practice, trustworthy, sophisticated
-
-**ASSET INTEGRATION MANDATE**: Use actual brand identity elements, not generic substitutes.
-**EVOLUTION MANDATE**: Improve upon previous designs, don't start from scratch.
-"""
+        def report(key: str, result: GenerationResult):
+            if result.success:
+                logger.info(f"✅ {label} {key} complete: {Path(result.filepath).name}")
+                if display:
+                    display.add(key, result.filepath)
+            else:
+                logger.warning(f"❌ {label} {key} failed: {result.error_message}")
+        
+        all_gemini = all(model == ModelType.GEMINI_FLASH for _, _, model, _ in jobs.values())
         
-        return self.workflow.generate_card(
+        if self.batch_mode and all_gemini and self.workflow.gemini_available:
+            # Review-quality Gemini phases are reviewed together anyway
+            results = self._generate_gemini_batch(jobs, shared_prompt)
+            for key, result in results.items():
+                report(key, result)
+        else:
+            # Bill the shared prefix once instead of once per option
+            cached_content = None
+            if shared_prompt and all_gemini:
+                cached_content = self.workflow.create_gemini_context_cache(
+                    self._build_enhanced_prompt(shared_prompt)
+                )
+            
+            try:
+                with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_GENERATIONS, len(jobs))) as executor:
+                    future_to_key = {
+                        executor.submit(
+                            self._generate_with_enhanced_prompt,
+                            *args,
+                            shared_prompt=shared_prompt,
+                            cached_content=cached_content
+                        ): key
+                        for key, args in jobs.items()
+                    }
+                    
+                    # Results are collected on this thread, so no locking is needed
+                    for future in as_completed(future_to_key):
+                        key = future_to_key[future]
+                        results[key] = future.result()
+                        report(key, results[key])
+            finally:
+                if cached_content:
+                    self.workflow.delete_gemini_context_cache(cached_content)
+        logger.info("")
+        
+        # Record in option order so the viewer lines images up with their keys
+        generated_images = []
+        for key in jobs:
+            result = results[key]
+            if result.success:
+                generated_images.append(result.filepath)
+                self.session_history.append(f"{label} {key}: {result.filepath}")
+                self.total_cost += result.cost_estimate
+        
+        return generated_images
+    
+    def _generate_gemini_batch(
+        self,
+        jobs: Dict[str, Tuple[str, str, ModelType, str]],
+        shared_prompt: str = ""
+    ) -> Dict[str, GenerationResult]:
+        """Generate Gemini jobs as a single batch-mode request"""
+        results: Dict[str, GenerationResult] = {}
+        pending: Dict[str, Tuple[str, str, ModelType, str]] = {}
+        
+        for key, (prompt, filename_prefix, model, quality) in jobs.items():
+            enhanced_prompt = self._build_enhanced_prompt(shared_prompt + prompt)
+            cached = self._load_cached_result(filename_prefix, enhanced_prompt, model, quality)
+            if cached:
+                results[key] = cached
+            else:
+                pending[filename_prefix] = (key, enhanced_prompt, model, quality)
+        
+        if pending:
+            quality = next(iter(pending.values()))[3]
+            batch_results = self.workflow.generate_gemini_batch(
+                {filename_prefix: enhanced_prompt for filename_prefix, (_, enhanced_prompt, _, _) in pending.items()},
+                side='front',
+                quality=quality
+            )
+            for filename_prefix, result in batch_results.items():
+                key, enhanced_prompt, model, quality = pending[filename_prefix]
+                self._store_cached_result(enhanced_prompt, model, quality, result)
+                results[key] = result
+        
+        return {key: results[key] for key in jobs}
+    
+    def _generate_with_enhanced_prompt(
+        self,
+        prompt: str,
+        filename_prefix: str,
+        model: ModelType,
+        quality: str,
+        shared_prompt: str = "",
+        cached_content: Optional[str] = None
+    ) -> GenerationResult:
+        """
+        Generate image with enhanced prompt including asset integration
+        
+        With cached_content, the shared prompt and universal requirements are
+        already in the Gemini context cache and only prompt itself is sent.
+        """
+        enhanced_prompt = self._build_enhanced_prompt(shared_prompt + prompt)
+        
+        cached = self._load_cached_result(filename_prefix, enhanced_prompt, model, quality)
+        if cached:
+            return cached
+        
+        result = self.workflow.generate_card(
             concept=filename_prefix,
             side='front', 
             model=model,
-            quality=quality
+            quality=quality,
+            prompt=prompt if cached_content else enhanced_prompt,
+            cached_content=cached_content
+        )
+        self._store_cached_result(enhanced_prompt, model, quality, result)
+        return result
+    
+    def _prompt_cache_path(self, enhanced_prompt: str, model: ModelType, quality: str) -> Path:
+        """Cache entry path for a prompt, model and quality combination"""
+        key = hashlib.sha256((enhanced_prompt + model.value + quality).encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
+    
+    def _load_cached_result(
+        self,
+        filename_prefix: str,
+        enhanced_prompt: str,
+        model: ModelType,
+        quality: str
+    ) -> Optional[GenerationResult]:
+        """Return the image an earlier run generated for this prompt, if it still exists"""
+        if not self.use_cache:
+            return None
+        
+        cache_path = self._prompt_cache_path(enhanced_prompt, model, quality)
+        try:
+            entry = json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            return None
+        
+        if not Path(entry.get('filepath', '')).exists():
+            return None
+        
+        logger.info(f"♻️ Reusing cached {filename_prefix}: {Path(entry['filepath']).name}")
+        return GenerationResult(
+            success=True,
+            filepath=entry['filepath'],
+            model_used=entry.get('model_used'),
+            cost_estimate=0.0  # Already paid for in an earlier run
         )
     
+    def _store_cached_result(self, enhanced_prompt: str, model: ModelType, quality: str, result: GenerationResult):
+        """Remember a successful generation so later runs can reuse it"""
+        if not (self.use_cache and result.success):
+            return
+        
+        cache_path = self._prompt_cache_path(enhanced_prompt, model, quality)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps({
+                'filepath': result.filepath,
+                'model_used': result.model_used,
+                'cost_estimate': result.cost_estimate,
+                'created_at': datetime.now().isoformat()
+            }))
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write prompt cache entry: {e}")
+    
+    def _build_enhanced_prompt(self, prompt: str) -> str:
+        """Append the universal requirements with asset integration to a prompt"""
+        return f"\n{prompt}\n\n{self.universal_requirements}"
+    
     def _get_layout_specific_guidance(self, layout_key: str, description: str) -> str:
         """Get specific guidance for each layout type"""
         guidance = {
@@ -460,38 +655,25 @@ Maximum quality combining real assets with iterative refinement.
         }
         return guidance.get(typo_key, "Professional typography treatment optimized for business cards")
     
+    @staticmethod
+    def _option_name(options: Dict[str, str], key: Optional[str]) -> Optional[str]:
+        """Short option name (before " - ") for the session summary"""
+        return options[key].split(' - ')[0] if key in options else key
+    
     def show_final_summary(self):
         """Show enhanced session summary with asset integration details"""
         print(f"\n📊 ENHANCED ITERATIVE WORKFLOW COMPLETE!")
         print("=" * 80)
         
         print(f"🎯 Your Enhanced Design Evolution:")
-        concept_desc = {
-            'A': 'Clinical Precision (Enhanced)',
-            'B': 'Athletic Performance (Enhanced)', 
-            'C': 'Luxury Wellness (Enhanced)',
-            'D': 'Minimalist Modern (Enhanced)'
-        }
-        layout_desc = {
-            '1': 'Centered Symmetrical',
-            '2': 'Left-Aligned Traditional',
-            '3': 'Dynamic Asymmetric', 
-            '4': 'Minimal Corner Accent'
-        }
-        typo_desc = {
-            'a': 'Bold Condensed (Enhanced)',
-            'b': 'Light Extended (Enhanced)',
-            'c': 'Medium Rounded (Enhanced)',
-            'd': 'Serif Classic (Enhanced)'
-        }
         
-        print(f"   Phase 1: {concept_desc.get(self.selected_concept, self.selected_concept)}")
-        print(f"   Phase 2: {layout_desc.get(self.selected_layout, self.selected_layout)}")
-        print(f"   Phase 3: {typo_desc.get(self.selected_typography, self.selected_typography)}")
+        print(f"   Phase 1: {self._option_name(self.CONCEPT_OPTIONS, self.selected_concept)}")
+        print(f"   Phase 2: {self._option_name(self.LAYOUT_OPTIONS, self.selected_layout)}")
+        print(f"   Phase 3: {self._option_name(self.TYPOGRAPHY_OPTIONS, self.selected_typography)}")
         print(f"   Phase 4: Enhanced Final Production Complete")
         
         print(f"\n🎨 Asset Integration Achievements:")
-        print(f"   • Logo Files: {len([k for k in self.assets.assets.keys() if 'logo' in k])} processed and integrated")
+        print(f"   • Logo Files: {self.assets.logo_count} processed and integrated")
         print(f"   • Previous Cards: {len(self.assets.previous_cards)} designs analyzed and evolved")
         print(f"   • Brand Colors: All exact hex values enforced")
         print(f"   • Design Evolution: Built upon existing work, didn't start from scratch")
@@ -518,8 +700,21 @@ Maximum quality combining real assets with iterative refinement.
 
 def main():
     """Main entry point for enhanced iterative workflow"""
+    parser = argparse.ArgumentParser(description="Enhanced iterative business card workflow")
+    parser.add_argument(
+        '--batch-mode',
+        action='store_true',
+        help="Run the Gemini layout and typography phases as batch jobs (half cost, slower)"
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Always generate new images instead of reusing ones from earlier runs"
+    )
+    args = parser.parse_args()
+    
     try:
-        workflow = EnhancedIterativeWorkflow()
+        workflow = EnhancedIterativeWorkflow(batch_mode=args.batch_mode, use_cache=not args.no_cache)
         workflow.run_complete_workflow()
         
     except KeyboardInterrupt:
@@ -7,28 +7,128 @@ Production-ready system that generates print-ready business cards
 NOT text descriptions - this actually generates PNG images with superior quality
 """
 
+import argparse
+import hashlib
+import importlib.util
 import os
+import shutil
+import struct
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
 
 # Check dependencies
 try:
-    from openai import OpenAI
-    from PIL import Image
     from dotenv import load_dotenv
     import base64
-    import io
-    import json
+    from validation.signatures import PNG_SIGNATURE
+    # The OpenAI SDK takes about half a second to import, so only confirm it
+    # is installed here; setup_api imports it once a client is needed
+    if importlib.util.find_spec("openai") is None:
+        raise ImportError("No module named 'openai'")
 except ImportError as e:
     print(f"❌ Missing dependency: {e}")
-    print("Install with: pip install openai python-dotenv Pillow")
+    print("Install with: pip install openai python-dotenv")
     sys.exit(1)
 
 # Load environment variables
 load_dotenv()
 
+# Rate limits, 5xx and timeouts are retried by the SDK with jittered
+# exponential backoff; auth and other 4xx errors fail immediately
+API_MAX_RETRIES = 3
+
+# IHDR colour type -> Pillow-style mode name
+PNG_COLOR_MODES = {0: "L", 2: "RGB", 3: "P", 4: "LA", 6: "RGBA"}
+
+def png_info(data: bytes) -> Optional[Tuple[int, int, str]]:
+    """
+    Read width, height and colour mode from a PNG's IHDR chunk
+    
+    Returns:
+        (width, height, mode) or None if data is not a PNG
+    """
+    if len(data) < 26 or not data.startswith(PNG_SIGNATURE) or data[12:16] != b"IHDR":
+        return None
+    width, height = struct.unpack(">II", data[16:24])
+    return width, height, PNG_COLOR_MODES.get(data[25], "unknown")
+
+# Prompts follow OpenAI GPT Image 1 best practices; BRAND_INFO fields are
+# filled in once per generator
+FRONT_PROMPT_TEMPLATE = """Ultra-premium business card front design with these EXACT specifications:
+
+**SUBJECT & CONTEXT:**
+Professional business card for Alex Shafiro PT, a premium rehabilitation specialist, 
+on a deep matte black background (#0A0A0A), embodying Equinox-meets-medical excellence.
+
+**STYLE & MEDIUM:**
+Clean, minimalist luxury design, flat artboard presentation (NO 3D mockups, NO shadows, NO perspective), 
+studio-quality commercial design, vector-sharp quality.
+
+**LIGHTING & MOOD:**
+Subtle emerald glow accent (#00C9A7) at 15% opacity, high contrast arctic white text (#FAFAFA), 
+sophisticated premium aesthetic commanding instant respect.
+
+**LAYOUT & FRAMING:**
+- Logo area (top-left): "A Stronger Life" company logo placeholder, exactly 0.75" height equivalent
+- Identity block (center-left): "{name}" in 14pt bold, tracked +50
+- Contact info (left column): Phone, email, location in clean hierarchy
+- QR code area (bottom-right): 0.5" x 0.5" placeholder for website QR code
+- Typography: Helvetica Neue or clean sans-serif, arctic white text
+
+**QUALITY MODIFIERS:**
+Professional design, ultra-detailed, print-ready quality, commercial grade, 
+exact business card proportions 3.5" x 2.0", high dynamic range.
+
+**CRITICAL REQUIREMENTS:**
+- Aspect ratio 16:9 to approximate business card proportions
+- Deep matte black background (not gray or charcoal)
+- Single emerald accent color only 
+- 40% negative space minimum
+- Flat artboard design ready for print
+- Text within safe zones
+
+Output a professional business card front design ready for immediate printing."""
+
+BACK_PROMPT_TEMPLATE = """Ultra-premium business card back design with these EXACT specifications:
+
+**SUBJECT & CONTEXT:**
+Professional business card back for premium rehabilitation practice, 
+deep matte black background (#0A0A0A), minimal luxury aesthetic.
+
+**STYLE & MEDIUM:**
+Clean, minimalist design, flat artboard presentation (NO 3D mockups, NO shadows), 
+studio-quality commercial design, vector-sharp quality.
+
+**LIGHTING & MOOD:**
+Subtle emerald glow underglow on main text (#00C9A7) at 20% opacity, 
+high contrast arctic white text (#FAFAFA), sophisticated restraint.
+
+**LAYOUT & FRAMING:**
+- Primary text (center): "Revolutionary Rehabilitation" in bold 16pt, tracked +150, all caps
+- Perfect optical centering with generous negative space
+- Optional: Subtle company logo watermark at 3% opacity maximum
+- QR code area (center-bottom): Small placeholder for website
+
+**QUALITY MODIFIERS:**
+Professional design, ultra-detailed, print-ready quality, commercial grade,
+exact business card proportions 3.5" x 2.0", high dynamic range.
+
+**CRITICAL REQUIREMENTS:**
+- Aspect ratio 16:9 to approximate business card proportions  
+- Deep matte black background (not gray)
+- Single emerald accent only
+- Minimal text - maximum impact
+- Flat artboard design ready for print
+- Premium restraint over embellishment
+
+Output a sophisticated business card back design ready for immediate printing."""
+
 class BusinessCardGenerator:
     """Generate Alex Shafiro PT business cards using OpenAI's GPT Image 1"""
     
@@ -52,8 +152,20 @@ class BusinessCardGenerator:
         "charcoal_shadow": "#1A1A1A"
     }
     
-    def __init__(self):
-        """Initialize the generator"""
+    CONCEPTS = ["Clinical-Precision", "Athletic-Edge", "Luxury-Wellness"]
+    
+    def __init__(self, use_cache: bool = True):
+        """
+        Initialize the generator
+        
+        Args:
+            use_cache: Reuse earlier images for identical prompts
+        """
+        self.use_cache = use_cache
+        # One timestamp names every card from this run
+        self.run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.front_prompt = FRONT_PROMPT_TEMPLATE.format_map(self.BRAND_INFO)
+        self.back_prompt = BACK_PROMPT_TEMPLATE.format_map(self.BRAND_INFO)
         self.setup_api()
         self.setup_directories()
         
@@ -71,8 +183,10 @@ class BusinessCardGenerator:
             sys.exit(1)
             
         try:
+            from openai import OpenAI
+            
             # Create the OpenAI client
-            self.client = OpenAI(api_key=api_key)
+            self.client = OpenAI(api_key=api_key, max_retries=API_MAX_RETRIES)
             print("✅ OpenAI client initialized")
             print("✨ Image generation ready (GPT Image 1 - Latest Model)")
         except Exception as e:
@@ -83,6 +197,9 @@ class BusinessCardGenerator:
         """Create output directories"""
         self.output_dir = Path("./output")
         self.output_dir.mkdir(exist_ok=True)
+        # Exact-match cache of generated images, keyed by prompt and settings
+        self.cache_dir = self.output_dir / ".cache"
+        self.cache_dir.mkdir(exist_ok=True)
         print(f"📁 Output directory: {self.output_dir.resolve()}")
     
     def generate_front_card(self, concept: str = "Clinical-Precision") -> Optional[str]:
@@ -96,44 +213,7 @@ class BusinessCardGenerator:
             Path to generated image file or None if failed
         """
         print(f"\n🎨 Generating front card - {concept.replace('-', ' ')}...")
-        
-        # Craft the prompt using OpenAI GPT Image 1 best practices
-        prompt = f"""Ultra-premium business card front design with these EXACT specifications:
-
-**SUBJECT & CONTEXT:**
-Professional business card for Alex Shafiro PT, a premium rehabilitation specialist, 
-on a deep matte black background (#0A0A0A), embodying Equinox-meets-medical excellence.
-
-**STYLE & MEDIUM:**
-Clean, minimalist luxury design, flat artboard presentation (NO 3D mockups, NO shadows, NO perspective), 
-studio-quality commercial design, vector-sharp quality.
-
-**LIGHTING & MOOD:**
-Subtle emerald glow accent (#00C9A7) at 15% opacity, high contrast arctic white text (#FAFAFA), 
-sophisticated premium aesthetic commanding instant respect.
-
-**LAYOUT & FRAMING:**
-- Logo area (top-left): "A Stronger Life" company logo placeholder, exactly 0.75" height equivalent
-- Identity block (center-left): "{self.BRAND_INFO['name']}" in 14pt bold, tracked +50
-- Contact info (left column): Phone, email, location in clean hierarchy
-- QR code area (bottom-right): 0.5" x 0.5" placeholder for website QR code
-- Typography: Helvetica Neue or clean sans-serif, arctic white text
-
-**QUALITY MODIFIERS:**
-Professional design, ultra-detailed, print-ready quality, commercial grade, 
-exact business card proportions 3.5" x 2.0", high dynamic range.
-
-**CRITICAL REQUIREMENTS:**
-- Aspect ratio 16:9 to approximate business card proportions
-- Deep matte black background (not gray or charcoal)
-- Single emerald accent color only 
-- 40% negative space minimum
-- Flat artboard design ready for print
-- Text within safe zones
-
-Output a professional business card front design ready for immediate printing."""
-
-        return self._generate_image(prompt, f"{concept}_front")
+        return self._generate_image(self.front_prompt, f"{concept}_front")
     
     def generate_back_card(self, concept: str = "Clinical-Precision") -> Optional[str]:
         """
@@ -146,42 +226,22 @@ Output a professional business card front design ready for immediate printing.""
             Path to generated image file or None if failed
         """
         print(f"\n🎨 Generating back card - {concept.replace('-', ' ')}...")
+        return self._generate_image(self.back_prompt, f"{concept}_back")
+    
+    def _output_path(self, filename_prefix: str) -> Path:
+        """
+        Unused output path for a card, stamped with the run's start time
         
-        prompt = f"""Ultra-premium business card back design with these EXACT specifications:
-
-**SUBJECT & CONTEXT:**
-Professional business card back for premium rehabilitation practice, 
-deep matte black background (#0A0A0A), minimal luxury aesthetic.
-
-**STYLE & MEDIUM:**
-Clean, minimalist design, flat artboard presentation (NO 3D mockups, NO shadows), 
-studio-quality commercial design, vector-sharp quality.
-
-**LIGHTING & MOOD:**
-Subtle emerald glow underglow on main text (#00C9A7) at 20% opacity, 
-high contrast arctic white text (#FAFAFA), sophisticated restraint.
-
-**LAYOUT & FRAMING:**
-- Primary text (center): "Revolutionary Rehabilitation" in bold 16pt, tracked +150, all caps
-- Perfect optical centering with generous negative space
-- Optional: Subtle company logo watermark at 3% opacity maximum
-- QR code area (center-bottom): Small placeholder for website
-
-**QUALITY MODIFIERS:**
-Professional design, ultra-detailed, print-ready quality, commercial grade,
-exact business card proportions 3.5" x 2.0", high dynamic range.
-
-**CRITICAL REQUIREMENTS:**
-- Aspect ratio 16:9 to approximate business card proportions  
-- Deep matte black background (not gray)
-- Single emerald accent only
-- Minimal text - maximum impact
-- Flat artboard design ready for print
-- Premium restraint over embellishment
-
-Output a sophisticated business card back design ready for immediate printing."""
-
-        return self._generate_image(prompt, f"{concept}_back")
+        Repeated cards from one run (--count) share a prefix and timestamp,
+        so later ones get a numeric suffix instead of overwriting the first.
+        """
+        stem = f"ASL_Alex_Shafiro_{filename_prefix}_{self.run_timestamp}"
+        filepath = self.output_dir / f"{stem}.png"
+        suffix = 2
+        while filepath.exists():
+            filepath = self.output_dir / f"{stem}_{suffix}.png"
+            suffix += 1
+        return filepath
     
     def _generate_image(self, prompt: str, filename_prefix: str) -> Optional[str]:
         """
@@ -189,20 +249,39 @@ Output a sophisticated business card back design ready for immediate printing.""
         
         Args:
             prompt: Text prompt for image generation
-            filename_prefix: Prefix for output filename
+            filename_prefix: Prefix for output filename; cards with different
+                prefixes (concept, side, variant) are cached apart
             
         Returns:
             Path to saved image or None if failed
         """
+        model, size, quality = 'gpt-image-1', '1536x1024', 'high'
+        
+        filepath = self._output_path(filename_prefix)
+        filename = filepath.name
+        
+        # Re-runs of an identical card request reuse the earlier image
+        cache_key = hashlib.sha256(
+            "\0".join((prompt, model, size, quality, filename_prefix)).encode('utf-8')
+        ).hexdigest()
+        cache_path = self.cache_dir / f"{cache_key}.png"
+        if self.use_cache and cache_path.exists():
+            try:
+                shutil.copyfile(cache_path, filepath)
+                print(f"  ♻️ Reused cached image: {filename}")
+                return str(filepath)
+            except OSError as cache_err:
+                print(f"  ⚠️ Could not reuse cached image: {cache_err}")
+        
         try:
             print(f"  🎨 Calling OpenAI GPT Image 1 API...")
             
             # Generate image using OpenAI's latest model
             response = self.client.images.generate(
-                model='gpt-image-1',
+                model=model,
                 prompt=prompt,
-                size='1536x1024',  # Wider format better for business cards
-                quality='high',     # High quality for professional printing
+                size=size,          # Wider format better for business cards
+                quality=quality,    # High quality for professional printing
                 n=1                 # Generate 1 image at a time
             )
             
@@ -225,35 +304,32 @@ Output a sophisticated business card back design ready for immediate printing.""
                 print(f"  ❌ Failed to decode base64 image: {decode_err}")
                 return None
             
-            # Create timestamp for unique filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"ASL_Alex_Shafiro_{filename_prefix}_{timestamp}.png"
-            filepath = self.output_dir / filename
+            # Check the PNG signature before anything touches the bytes
+            info = png_info(image_data)
+            if not info:
+                print(f"  ❌ Malformed image bytes from OpenAI")
+                return None
             
-            # Save the image
+            # Save the API's PNG bytes as-is; there is nothing to re-encode
             try:
-                with open(filepath, 'wb') as f:
-                    f.write(image_data)
+                filepath.write_bytes(image_data)
             except Exception as save_err:
                 print(f"  ❌ Failed to save image: {save_err}")
                 return None
             
-            # Verify the file was created and has content
-            if not filepath.exists() or filepath.stat().st_size == 0:
-                print(f"  ❌ Failed to save image file")
-                return None
+            try:
+                shutil.copyfile(filepath, cache_path)
+            except OSError as cache_err:
+                print(f"  ⚠️ Could not cache image: {cache_err}")
             
             print(f"  ✅ Image generated successfully: {filename}")
-            print(f"  📏 File size: {filepath.stat().st_size / 1024:.1f} KB")
+            print(f"  📏 File size: {len(image_data) / 1024:.1f} KB")
             
-            # Display image info using PIL
-            try:
-                with Image.open(filepath) as img:
-                    print(f"  🖼️ Dimensions: {img.width}x{img.height} pixels")
-                    print(f"  🎨 Format: {img.format} ({img.mode})")
-                    print(f"  💎 Quality: High (GPT Image 1 Premium)")
-            except Exception as img_err:
-                print(f"  ⚠️ Could not read image info: {img_err}")
+            # Display image info straight from the PNG header
+            width, height, mode = info
+            print(f"  🖼️ Dimensions: {width}x{height} pixels")
+            print(f"  🎨 Format: PNG ({mode})")
+            print(f"  💎 Quality: High (GPT Image 1 Premium)")
             
             return str(filepath)
                 
@@ -285,17 +361,55 @@ Output a sophisticated business card back design ready for immediate printing.""
         """
         print(f"\n🏥 Generating {concept.replace('-', ' ')} business card set...")
         
+        # Both sides are independent API round-trips, so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                'front': executor.submit(self.generate_front_card, concept),
+                'back': executor.submit(self.generate_back_card, concept)
+            }
+        
         results = {}
+        for side, future in futures.items():
+            result = future.result()
+            if result:
+                results[side] = result
+        
+        return results
+    
+    def generate_variants(
+        self,
+        concept: str = "Clinical-Precision",
+        n: int = 4,
+        max_workers: int = 4
+    ) -> Dict[str, Dict[str, Optional[str]]]:
+        """
+        Generate n alternative front and back cards for a concept to pick from
+        
+        Args:
+            concept: Design concept to generate
+            n: Number of variants per side
+            max_workers: Maximum concurrent API requests, to stay under rate limits
+            
+        Returns:
+            Dict of '{concept}-v{i}' to front/back file paths
+        """
+        print(f"\n🏥 Generating {n} {concept.replace('-', ' ')} variants per side...")
         
-        # Generate front card
-        front_result = self.generate_front_card(concept)
-        if front_result:
-            results['front'] = front_result
+        prompts = {'front': self.front_prompt, 'back': self.back_prompt}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                (i, side): executor.submit(
+                    self._generate_image, prompt, f"{concept}-v{i}_{side}"
+                )
+                for i in range(1, n + 1)
+                for side, prompt in prompts.items()
+            }
         
-        # Generate back card  
-        back_result = self.generate_back_card(concept)
-        if back_result:
-            results['back'] = back_result
+        results = {}
+        for (i, side), future in futures.items():
+            result = future.result()
+            if result:
+                results.setdefault(f"{concept}-v{i}", {})[side] = result
         
         return results
     
@@ -309,16 +423,26 @@ Output a sophisticated business card back design ready for immediate printing.""
         print("🎯 Generating Alex Shafiro PT Premium Business Card System")
         print("Based on PRD specifications - Equinox meets Mayo Clinic\n")
         
-        concepts = [
-            "Clinical-Precision",
-            "Athletic-Edge", 
-            "Luxury-Wellness"
-        ]
+        # All six cards are independent API round-trips, so request them at once
+        with ThreadPoolExecutor(max_workers=2 * len(self.CONCEPTS)) as executor:
+            futures = {
+                (concept, side): executor.submit(generate, concept)
+                for concept in self.CONCEPTS
+                for side, generate in (
+                    ('front', self.generate_front_card),
+                    ('back', self.generate_back_card)
+                )
+            }
         
         all_results = {}
         
-        for concept in concepts:
-            results = self.generate_concept_set(concept)
+        for concept in self.CONCEPTS:
+            results = {}
+            for side in ('front', 'back'):
+                result = futures[(concept, side)].result()
+                if result:
+                    results[side] = result
+            
             if results:
                 all_results[concept] = results
                 print(f"✅ {concept.replace('-', ' ')} concept complete")
@@ -371,13 +495,54 @@ def print_results(all_results: Dict[str, Dict[str, Optional[str]]], generator):
     print(f"\n📊 Generated {total_images} high-quality images")
     print(f"💰 Estimated Gemini API cost: ~${total_images * 0.005:.3f}")
 
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Alex Shafiro PT business card generator")
+    parser.add_argument(
+        "--concept",
+        choices=["all"] + BusinessCardGenerator.CONCEPTS,
+        help="Concept to generate; skips the option menu"
+    )
+    parser.add_argument(
+        "--yes", "-y",
+        action="store_true",
+        help="Do not ask for confirmation (implied when stdin is not a terminal)"
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=1,
+        help="Number of fresh rounds to generate; more than one implies --no-cache"
+    )
+    parser.add_argument(
+        "--variants",
+        type=int,
+        default=1,
+        help="Alternative designs per side to generate for each concept"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the API, even for a prompt generated before"
+    )
+    args = parser.parse_args()
+    if args.count < 1:
+        parser.error("--count must be at least 1")
+    if args.variants < 1:
+        parser.error("--variants must be at least 1")
+    return args
+
 def main():
     """Main application entry point"""
+    args = parse_args()
+    # Pipelines and CI have no one to answer prompts
+    interactive = sys.stdin.isatty() and not args.yes
+    
     print_banner()
     
     # Initialize generator
     try:
-        generator = BusinessCardGenerator()
+        generator = BusinessCardGenerator(use_cache=not args.no_cache and args.count == 1)
     except SystemExit:
         return
     
@@ -390,50 +555,62 @@ def main():
     print(f"• Website: {brand['website']}")
     print()
     
-    # Generation options
-    print("🎨 Generation Options:")
-    print("1. Generate all three concepts (Recommended)")
-    print("2. Generate single concept (Clinical Precision)")
-    print("3. Generate single concept (Athletic Edge)")
-    print("4. Generate single concept (Luxury Wellness)")
-    print()
-    
-    choice = input("Select option (1-4): ").strip()
+    concept = args.concept
+    if concept is None and not interactive:
+        concept = "all"
     
-    if choice == "1":
-        # Generate all concepts
-        proceed = input("Generate all three concept variations? (y/n): ").strip().lower()
-        if proceed not in ['y', 'yes']:
-            print("❌ Generation cancelled")
-            return
-        
-        all_results = generator.generate_all_concepts()
-        print_results(all_results, generator)
+    if concept is None:
+        # Generation options
+        print("🎨 Generation Options:")
+        print("1. Generate all three concepts (Recommended)")
+        print("2. Generate single concept (Clinical Precision)")
+        print("3. Generate single concept (Athletic Edge)")
+        print("4. Generate single concept (Luxury Wellness)")
+        print()
         
-    elif choice in ["2", "3", "4"]:
-        # Generate single concept
+        choice = input("Select option (1-4): ").strip()
         concept_map = {
+            "1": "all",
             "2": "Clinical-Precision",
             "3": "Athletic-Edge",
-            "4": "Luxury-Wellness" 
+            "4": "Luxury-Wellness"
         }
         
+        if choice not in concept_map:
+            print("❌ Invalid selection")
+            return
         concept = concept_map[choice]
-        concept_name = concept.replace('-', ' ')
-        
-        proceed = input(f"Generate {concept_name} concept? (y/n): ").strip().lower()
+    
+    if interactive:
+        if concept == "all":
+            question = "Generate all three concept variations? (y/n): "
+        else:
+            question = f"Generate {concept.replace('-', ' ')} concept? (y/n): "
+        proceed = input(question).strip().lower()
         if proceed not in ['y', 'yes']:
             print("❌ Generation cancelled")
             return
-        
-        results = generator.generate_concept_set(concept)
-        if results:
-            print_results({concept: results}, generator)
+    
+    all_results = {}
+    for round_number in range(1, args.count + 1):
+        if args.variants > 1:
+            concepts = generator.CONCEPTS if concept == "all" else [concept]
+            round_results = {}
+            for name in concepts:
+                round_results.update(generator.generate_variants(name, args.variants))
+        elif concept == "all":
+            round_results = generator.generate_all_concepts()
         else:
-            print(f"❌ {concept_name} generation failed")
+            results = generator.generate_concept_set(concept)
+            if not results:
+                print(f"❌ {concept.replace('-', ' ')} generation failed")
+            round_results = {concept: results} if results else {}
+        
+        for name, files in round_results.items():
+            key = f"{name}-{round_number}" if args.count > 1 else name
+            all_results[key] = files
     
-    else:
-        print("❌ Invalid selection")
+    print_results(all_results, generator)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
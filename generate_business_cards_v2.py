@@ -27,7 +27,7 @@ try:
 except ImportError as e:
     print(f"❌ Missing dependency: {e}")
     print("Setup required:")
-    print("1. pip install openai>=1.51.0 google-genai>=1.0.0 python-dotenv Pillow")
+    print("1. pip install openai>=1.51.0 google-genai>=1.22.0 python-dotenv Pillow")
     print("2. Create .env file with API keys")
     sys.exit(1)
 
@@ -113,18 +113,18 @@ class BusinessCardGeneratorV2:
             print("❌ Generation cancelled")
             return
             
+        # Every card is an independent API round-trip, so request them all
+        # at once; the workflow caps how many are in flight
+        cards = [(concept, side) for concept in concepts for side in ("front", "back")]
+        batch_results = self.workflow.generate_cards_batch(cards, ModelType.AUTO, quality)
+        
         all_results = {}
         
-        for concept in concepts:
-            print(f"\n📐 Processing {concept.replace('-', ' ')}...")
-            results = self.workflow.generate_full_concept_set(concept, quality)
-            
-            if results:
-                all_results[concept] = results
+        for (concept, side), result in zip(cards, batch_results):
+            if result.success:
+                all_results.setdefault(concept, {})[side] = result
                 # Track costs
-                for result in results.values():
-                    if result.success:
-                        self.session_costs.append(result.cost_estimate)
+                self.session_costs.append(result.cost_estimate)
                         
         self.print_generation_results(all_results)
         
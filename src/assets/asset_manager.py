@@ -6,7 +6,7 @@ Manages brand assets for business card generation
 
 import base64
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from PIL import Image
 import io
 
@@ -34,6 +34,11 @@ class AssetManager:
             "charcoal_shadow": "#1A1A1A"
         }
         
+        # Encoded logos keyed by (path, mtime, size) and concept prompts,
+        # filled on first use
+        self._logo_b64: Dict[Tuple[str, int, int], str] = {}
+        self._concept_prompts: Optional[Dict[str, str]] = None
+        
         self._discover_assets()
     
     def _discover_assets(self):
@@ -145,13 +150,24 @@ Clean, sophisticated, trustworthy, high-end rehabilitation practice.
             Base64 encoded logo or None
         """
         logo_path = self.get_logo_path(orientation)
+        if not logo_path:
+            return None
         
-        if not logo_path or not Path(logo_path).exists():
+        try:
+            # The stat doubles as the existence check and invalidates the
+            # cached encoding when the logo file is replaced
+            stat = Path(logo_path).stat()
+        except OSError:
             return None
         
+        key = (logo_path, stat.st_mtime_ns, stat.st_size)
+        if key in self._logo_b64:
+            return self._logo_b64[key]
+        
         try:
-            with open(logo_path, 'rb') as f:
-                encoded = base64.b64encode(f.read()).decode('utf-8')
+            # Base64 output is pure ASCII, so skip the UTF-8 validation
+            encoded = base64.b64encode(Path(logo_path).read_bytes()).decode('ascii')
+            self._logo_b64[key] = encoded
             return encoded
         except Exception as e:
             print(f"❌ Failed to encode logo: {e}")
@@ -173,6 +189,12 @@ Clean, sophisticated, trustworthy, high-end rehabilitation practice.
     
     def create_concept_prompts(self) -> Dict[str, str]:
         """Create 4 distinct concept prompts for Phase 1"""
+        if self._concept_prompts is None:
+            self._concept_prompts = self._build_concept_prompts()
+        return dict(self._concept_prompts)
+    
+    def _build_concept_prompts(self) -> Dict[str, str]:
+        """Build the concept prompts from the assets discovered at startup"""
         base_prompt = self.get_complete_brand_prompt()
         
         concepts = {
@@ -41,10 +41,14 @@ class RealAssetManager:
         self._discover_and_process_assets()
         self._analyze_previous_cards()
         
+        # Built on first use; assets are not re-read after discovery
+        self._concept_prompts: Optional[Dict[str, str]] = None
+        
     def _discover_and_process_assets(self):
         """Find, process, and prepare logo assets for AI integration"""
         self.assets = {}
         self.logo_descriptions = {}
+        self.logo_count = 0
         
         if not self.assets_dir.exists():
             print(f"⚠️ Assets directory not found: {self.assets_dir}")
@@ -70,6 +74,8 @@ class RealAssetManager:
                     self.assets['icon'] = file_path
                     self._analyze_logo(file_path, 'icon')
         
+        self.logo_count = sum(1 for key in self.assets if 'logo' in key)
+        
         print(f"✅ Processed {len(self.assets)} brand assets:")
         for key, path in self.assets.items():
             print(f"   • {key}: {path.name}")
@@ -136,18 +142,20 @@ class RealAssetManager:
             for pattern in ["*.png", "*.jpg", "*.jpeg"]:
                 card_files.extend(self.output_dir.rglob(pattern))
             
+            # Filter by filename first so only candidate cards are stat'ed, once each
+            cards = [(card_file, card_file.stat()) for card_file in card_files if self._is_business_card(card_file)]
+            
             # Sort by modification time (newest first)
-            card_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+            cards.sort(key=lambda card: card[1].st_mtime, reverse=True)
             
             # Take the 3 most recent cards as reference
-            for card_file in card_files[:3]:
-                if self._is_business_card(card_file):
-                    self.previous_cards.append({
-                        'path': card_file,
-                        'filename': card_file.name,
-                        'size_mb': round(card_file.stat().st_size / (1024 * 1024), 1),
-                        'description': self._describe_card(card_file)
-                    })
+            for card_file, card_stat in cards[:3]:
+                self.previous_cards.append({
+                    'path': card_file,
+                    'filename': card_file.name,
+                    'size_mb': round(card_stat.st_size / (1024 * 1024), 1),
+                    'description': self._describe_card(card_file)
+                })
         
         if self.previous_cards:
             print(f"✅ Found {len(self.previous_cards)} previous business cards as reference:")
@@ -270,6 +278,12 @@ Layout: {logo_desc.get('layout', 'standard')}
     
     def create_enhanced_concept_prompts(self) -> Dict[str, str]:
         """Create concept prompts that actually use real assets and previous work"""
+        if self._concept_prompts is None:
+            self._concept_prompts = self._build_enhanced_concept_prompts()
+        return dict(self._concept_prompts)
+    
+    def _build_enhanced_concept_prompts(self) -> Dict[str, str]:
+        """Build the concept prompts from the assets analyzed at startup"""
         
         # Get logo and reference integration
         logo_prompt = self.get_logo_integration_prompt()
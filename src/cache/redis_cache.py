@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Generation Result Cache for the Business Card Generator API
+
+Two cache tiers keyed by "{concept}:{side}:{quality}:{model}":
+- A small process-local TTL cache, so hot keys skip Redis entirely
+- Redis, shared by every API worker (gen:{key} -> JSON result)
+
+Concurrent misses for the same key are coalesced: the first job takes an
+inflight:{key} lock and generates, the others wait on the inflight:{key}
+pubsub channel and read the result from the cache.
+
+Only result metadata is cached; image bytes stay on disk at result.filepath.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+import structlog
+
+from hybrid.modern_workflow import GenerationResult
+
+logger = structlog.get_logger(__name__)
+
+# Generated cards never change for a given key; keep them a week in Redis
+CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+LOCAL_CACHE_MAXSIZE = 1024
+LOCAL_CACHE_TTL_SECONDS = 300
+
+# Upper bound on one generation; an abandoned in-flight lock expires after this
+INFLIGHT_TTL_SECONDS = 120
+
+RELEASE_INFLIGHT_SCRIPT = Path(__file__).parent / "release_inflight.lua"
+
+
+def cache_key(key: str) -> str:
+    """Redis key for a cached generation result"""
+    return f"gen:{key}"
+
+
+def inflight_key(key: str) -> str:
+    """Redis key (and pubsub channel) for a generation in progress"""
+    return f"inflight:{key}"
+
+
+class LocalTTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed TTL"""
+
+    def __init__(self, maxsize: int = LOCAL_CACHE_MAXSIZE, ttl: float = LOCAL_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        """Drop a key if present"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class GenerationCache:
+    """Cache successful generation results in front of the model APIs"""
+
+    def __init__(
+        self,
+        redis_client,
+        ttl: int = CACHE_TTL_SECONDS,
+        local_maxsize: int = LOCAL_CACHE_MAXSIZE,
+        local_ttl: float = LOCAL_CACHE_TTL_SECONDS
+    ):
+        """
+        Initialize generation cache
+
+        Args:
+            redis_client: redis.asyncio client created with decode_responses=True
+            ttl: Seconds a result lives in Redis
+            local_maxsize: Maximum entries held in the process-local cache
+            local_ttl: Seconds a result lives in the process-local cache
+        """
+        self.redis = redis_client
+        self.ttl = ttl
+        self.local = LocalTTLCache(maxsize=local_maxsize, ttl=local_ttl)
+        self.release_script = RELEASE_INFLIGHT_SCRIPT.read_text()
+
+    async def get_cached(self, key: str) -> Optional[GenerationResult]:
+        """Return a cached result, checking the local cache before Redis"""
+        result = self.local.get(key)
+        if result is not None:
+            return result
+
+        return self.load(key, await self.redis.get(cache_key(key)))
+
+    async def cache_result(self, key: str, result: GenerationResult) -> None:
+        """Store a successful result in Redis and refresh the local entry"""
+        pipe = self.redis.pipeline(transaction=False)
+        self.queue_store(pipe, key, result)
+        await pipe.execute()
+
+    def queue_get(self, pipe, key: str) -> None:
+        """Queue the Redis read for a key on a caller's pipeline; see load()"""
+        pipe.get(cache_key(key))
+
+    def load(self, key: str, raw: Optional[str]) -> Optional[GenerationResult]:
+        """Decode a raw Redis cache entry and hold it in the local cache"""
+        if not raw:
+            return None
+
+        try:
+            result = GenerationResult(**orjson.loads(raw))
+        except (TypeError, ValueError) as e:
+            logger.warning("Discarding unreadable cache entry", cache_key=key, error=str(e))
+            return None
+
+        self.local.set(key, result)
+        return result
+
+    def queue_store(self, pipe, key: str, result: GenerationResult) -> None:
+        """Queue storing a successful result on a caller's pipeline"""
+        if not result.success:
+            return
+
+        data = asdict(result)
+        data["image_data"] = None
+        pipe.set(cache_key(key), orjson.dumps(data), ex=self.ttl)
+
+        self.local.pop(key)
+        self.local.set(key, GenerationResult(**data))
+
+    async def acquire_inflight(self, key: str, job_id: str, ttl: int = INFLIGHT_TTL_SECONDS) -> bool:
+        """Claim generation of a key; False if another job is already on it"""
+        return bool(await self.redis.set(inflight_key(key), job_id, nx=True, ex=ttl))
+
+    async def release_inflight(self, key: str, job_id: str) -> None:
+        """
+        Drop the in-flight lock held by job_id and wake any waiting jobs
+
+        The ownership check and delete run as one Lua script, so a lock that
+        expired and was taken by another job is never deleted here.
+        """
+        await self.redis.eval(self.release_script, 1, inflight_key(key), job_id)
+        await self.redis.publish(inflight_key(key), job_id)
+
+    async def wait_for_inflight(self, key: str, timeout: float = INFLIGHT_TTL_SECONDS) -> Optional[GenerationResult]:
+        """
+        Wait for the job generating a key to finish and return its result
+
+        Returns:
+            Cached result, or None if the leader failed or did not finish in time
+        """
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(inflight_key(key))
+        try:
+            # The leader may have finished before we subscribed
+            if await self.redis.exists(inflight_key(key)):
+                deadline = time.monotonic() + timeout
+                while (remaining := deadline - time.monotonic()) > 0:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=remaining)
+                    if message is not None:
+                        break
+            return await self.get_cached(key)
+        finally:
+            await pubsub.unsubscribe(inflight_key(key))
+            await pubsub.aclose()
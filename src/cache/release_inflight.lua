@@ -0,0 +1,13 @@
+-- Release an in-flight generation lock only if the caller still holds it
+--
+-- KEYS[1]  inflight:{key}
+-- ARGV[1]  job id that took the lock
+--
+-- Returns 1 if the lock was deleted, 0 if it had expired or been taken by
+-- another job in the meantime.
+
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+
+return 0
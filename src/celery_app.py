@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Celery Application for Business Card Generator
+
+Generation jobs are queued on Redis by the API and consumed by dedicated
+worker processes, so a 30-60s generation never ties up an API worker.
+
+Run a worker from the project root with:
+    celery -A src.celery_app worker --loglevel=info
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from celery import Celery
+from celery.signals import worker_init, worker_process_shutdown
+from prometheus_client import REGISTRY, CollectorRegistry, multiprocess, start_http_server
+
+# Make src modules importable when loaded as src.celery_app by the worker
+sys.path.insert(0, str(Path(__file__).parent))
+
+# Generation metrics are recorded in the worker, which has no API to expose
+# them on; the main worker process serves them for Prometheus on this port
+WORKER_METRICS_PORT = int(os.getenv("WORKER_METRICS_PORT", "9808"))
+
+broker_url = os.getenv('CELERY_BROKER_URL') or os.getenv('REDIS_URL', 'redis://localhost:6379')
+
+celery_app = Celery(
+    "business_cards",
+    broker=broker_url,
+    include=["jobs.tasks"]
+)
+
+celery_app.conf.update(
+    task_serializer="json",
+    accept_content=["json"],
+    # Job state lives in the job store, not the Celery result backend
+    task_ignore_result=True,
+    # Generations are long; hand out one job per worker process at a time and
+    # only acknowledge it once finished so a crashed worker's job is redelivered
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+)
+
+
+@worker_init.connect
+def start_worker_metrics_server(**kwargs):
+    """
+    Serve this worker's Prometheus metrics, e.g. generation_duration_seconds
+
+    Prefork pool processes each hold their own metric values. Set
+    PROMETHEUS_MULTIPROC_DIR (an empty, existing directory) for the worker so
+    they are written there and aggregated here; without it only values
+    recorded in the main process (solo or threads pool) are served.
+    """
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    start_http_server(WORKER_METRICS_PORT, registry=registry)
+
+
+@worker_process_shutdown.connect
+def mark_metrics_process_dead(pid=None, **kwargs):
+    """Drop the live gauge values of a pool process that exited"""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid or os.getpid())
@@ -27,25 +27,45 @@ class ImageViewer:
         print(f"\n📸 Opening {len(image_paths)} images for your review...")
         
         for i, path in enumerate(image_paths):
-            if Path(path).exists():
-                try:
-                    # Open image in default viewer
-                    if sys.platform == "darwin":  # macOS
-                        subprocess.run(['open', path], check=True)
-                    elif sys.platform == "linux":
-                        subprocess.run(['xdg-open', path], check=True)
-                    elif sys.platform == "win32":
-                        subprocess.run(['start', path], shell=True, check=True)
-                    
-                    self.opened_images.append(path)
-                    time.sleep(0.5)  # Small delay between opens
-                    
-                except subprocess.CalledProcessError:
-                    print(f"⚠️ Could not open {path}")
-            else:
-                print(f"❌ File not found: {path}")
+            if self._open_image(path):
+                time.sleep(0.5)  # Small delay between opens
         
         print(f"✅ Images opened in your default viewer")
+    
+    def _open_image(self, path: str) -> bool:
+        """Open a single image in the system default viewer"""
+        if not Path(path).exists():
+            print(f"❌ File not found: {path}")
+            return False
+        
+        try:
+            # Open image in default viewer
+            if sys.platform == "darwin":  # macOS
+                subprocess.run(['open', path], check=True)
+            elif sys.platform == "linux":
+                subprocess.run(['xdg-open', path], check=True)
+            elif sys.platform == "win32":
+                subprocess.run(['start', path], shell=True, check=True)
+            
+            self.opened_images.append(path)
+            return True
+            
+        except subprocess.CalledProcessError:
+            print(f"⚠️ Could not open {path}")
+            return False
+    
+    def display_incremental(self, options: Dict[str, str]) -> "IncrementalDisplay":
+        """
+        Start a review step whose images open as soon as each one is ready
+        
+        Args:
+            options: Dict mapping option keys to descriptions
+            
+        Returns:
+            IncrementalDisplay to add images to and finish with a selection
+        """
+        print(f"\n📸 Images will open for review as they finish generating...")
+        return IncrementalDisplay(self, options)
         
     def show_options_and_get_choice(self, options: Dict[str, str]) -> str:
         """
@@ -131,4 +151,29 @@ class ImageViewer:
         
         self.display_images(image_paths, {})
         
-        input(f"\nPress Enter when you've reviewed all {len(image_paths)} images...")
\ No newline at end of file
+        input(f"\nPress Enter when you've reviewed all {len(image_paths)} images...")
+
+
+class IncrementalDisplay:
+    """One review step whose images are shown as they arrive"""
+    
+    def __init__(self, viewer: ImageViewer, options: Dict[str, str]):
+        self.viewer = viewer
+        self.options = options
+        self.image_paths: Dict[str, str] = {}
+        
+    def add(self, key: str, image_path: str) -> None:
+        """Show the newly generated image for an option"""
+        self.image_paths[key] = image_path
+        self.viewer._open_image(image_path)
+        
+    def finalize_and_select(self) -> Tuple[str, str]:
+        """
+        Get user selection among the options that produced an image
+        
+        Returns:
+            Tuple of (selected_key, selected_image_path)
+        """
+        available = {key: desc for key, desc in self.options.items() if key in self.image_paths}
+        selected_key = self.viewer.show_options_and_get_choice(available)
+        return selected_key, self.image_paths[selected_key]
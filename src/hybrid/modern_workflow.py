@@ -17,25 +17,58 @@ Based on MASTER_IMPLEMENTATION_GUIDE.md specifications
 import os
 import base64
 import io
+import struct
+import sys
+import time
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Optional, Dict, List, Literal
+from typing import Optional, Dict, List, Literal, Tuple, Callable
 from dataclasses import dataclass
 from enum import Enum
 
 try:
     from openai import OpenAI
     from google import genai
+    from google.genai import types as genai_types
     from PIL import Image
     from dotenv import load_dotenv
 except ImportError as e:
     print(f"❌ Missing dependency: {e}")
-    print("Install with: pip install openai>=1.51.0 google-genai>=1.0.0 python-dotenv Pillow")
+    print("Install with: pip install openai>=1.51.0 google-genai>=1.22.0 python-dotenv Pillow")
     raise
 
+# Resolve sibling packages under src when this module is run directly
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validation.signatures import IMAGE_FORMATS, IMAGE_SIGNATURES, PNG_SIGNATURE
+
 # Load environment variables
 load_dotenv()
 
+# Transient failures (rate limits, 5xx, timeouts) are retried with jittered
+# exponential backoff by the SDK clients; auth and other 4xx errors are not
+API_MAX_RETRIES = 3
+GEMINI_RETRY_STATUS_CODES = [408, 429, 500, 502, 503, 504]
+
+# PNG IHDR colour types that Pillow opens as RGB and RGBA
+PNG_RGB_COLOR_TYPES = (2, 6)
+
+# Gemini batch-mode jobs are queued server-side and polled until they finish
+GEMINI_BATCH_POLL_SECONDS = 10.0
+GEMINI_BATCH_TIMEOUT_SECONDS = 30 * 60
+GEMINI_BATCH_DONE_STATES = (
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_PARTIALLY_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+)
+GEMINI_BATCH_SUCCESS_STATES = ("JOB_STATE_SUCCEEDED", "JOB_STATE_PARTIALLY_SUCCEEDED")
+
+# Shared prompt prefixes live in Gemini's context cache only while one phase runs
+GEMINI_CONTEXT_CACHE_TTL_SECONDS = 600
+
 class ModelType(Enum):
     """Available AI models for generation"""
     GPT_IMAGE_1 = "gpt-image-1"
@@ -88,10 +121,27 @@ class ModernHybridWorkflow:
         "gpt_image_1_medium": 0.07,
         "gpt_image_1_high": 0.19,
         "gemini_flash": 0.005,
+        "gemini_flash_batch": 0.0025,  # Batch mode bills at 50% of real-time
+    }
+    
+    # Design direction added to the universal prompt for each concept
+    CONCEPT_STYLES = {
+        "Clinical-Precision": "Medical authority focus, symmetric layout, clinical trust",
+        "Athletic-Edge": "Dynamic energy, performance-focused design elements",
+        "Luxury-Wellness": "Equinox-level luxury, spa-like sophistication"
+    }
+    
+    # GPT Image 1 request parameters and per-image cost for each quality level
+    GPT_QUALITY_SETTINGS = {
+        "draft": {"quality": "low", "size": "1024x1024", "cost": COSTS["gpt_image_1_low"]},
+        "review": {"quality": "medium", "size": "1536x1024", "cost": COSTS["gpt_image_1_medium"]},
+        "production": {"quality": "high", "size": "1536x1024", "cost": COSTS["gpt_image_1_high"]}
     }
     
     def __init__(self):
         """Initialize modern hybrid workflow with both clients"""
+        # Rendered universal prompts by (concept, side); brand data never changes
+        self._universal_prompts: Dict[Tuple[str, str], str] = {}
         self.setup_clients()
         self.setup_directories()
         
@@ -100,7 +150,7 @@ class ModernHybridWorkflow:
         # OpenAI GPT Image 1 client
         openai_key = os.getenv('OPENAI_API_KEY')
         if openai_key:
-            self.openai_client = OpenAI(api_key=openai_key)
+            self.openai_client = OpenAI(api_key=openai_key, max_retries=API_MAX_RETRIES)
             self.openai_available = True
             print("✅ OpenAI GPT Image 1 ready")
         else:
@@ -111,7 +161,15 @@ class ModernHybridWorkflow:
         # Gemini 2.5 Flash Image client  
         gemini_key = os.getenv('GOOGLE_API_KEY') or os.getenv('GEMINI_API_KEY')
         if gemini_key:
-            self.gemini_client = genai.Client(api_key=gemini_key)
+            self.gemini_client = genai.Client(
+                api_key=gemini_key,
+                http_options=genai_types.HttpOptions(
+                    retry_options=genai_types.HttpRetryOptions(
+                        attempts=API_MAX_RETRIES + 1,  # Includes the first try
+                        http_status_codes=GEMINI_RETRY_STATUS_CODES
+                    )
+                )
+            )
             self.gemini_available = True
             print("✅ Google Gemini 2.5 Flash Image ready")
         else:
@@ -138,7 +196,9 @@ class ModernHybridWorkflow:
         concept: str = "Clinical-Precision", 
         side: str = "front",
         model: ModelType = ModelType.AUTO,
-        quality: Literal["draft", "review", "production"] = "production"
+        quality: Literal["draft", "review", "production"] = "production",
+        prompt: Optional[str] = None,
+        cached_content: Optional[str] = None
     ) -> GenerationResult:
         """
         Generate business card with intelligent model selection
@@ -148,6 +208,9 @@ class ModernHybridWorkflow:
             side: 'front' or 'back'
             model: Specific model to use or AUTO for intelligent selection
             quality: Quality level affecting model and cost selection
+            prompt: Full prompt to send instead of the built-in universal prompt
+            cached_content: Gemini context cache holding the start of the prompt
+                (see create_gemini_context_cache); prompt is then only the rest
             
         Returns:
             GenerationResult with image data and metadata
@@ -164,13 +227,14 @@ class ModernHybridWorkflow:
             )
         
         # Build prompt optimized for selected model
-        prompt = self._build_universal_prompt(concept, side)
+        if prompt is None:
+            prompt = self._build_universal_prompt(concept, side)
         
         try:
             if selected_model == ModelType.GPT_IMAGE_1:
                 result = self._generate_with_gpt_image(prompt, quality)
             elif selected_model == ModelType.GEMINI_FLASH:
-                result = self._generate_with_gemini(prompt)
+                result = self._generate_with_gemini(prompt, cached_content)
             else:
                 return GenerationResult(
                     success=False,
@@ -179,7 +243,7 @@ class ModernHybridWorkflow:
             
             if result.success:
                 # Save to appropriate directory
-                directory = self.production_dir if quality == "production" else self.drafts_dir
+                directory = self._output_dir(quality)
                 filepath = self._save_image(
                     result.image_data, 
                     concept, 
@@ -205,6 +269,67 @@ class ModernHybridWorkflow:
                 model_used=selected_model.value if selected_model else None
             )
 
+    def generate_card_variants(
+        self,
+        concept: str = "Clinical-Precision",
+        side: str = "front",
+        model: ModelType = ModelType.AUTO,
+        quality: Literal["draft", "review", "production"] = "production",
+        n: int = 2,
+        prompt: Optional[str] = None
+    ) -> List[GenerationResult]:
+        """
+        Generate n alternative images of the same card
+        
+        GPT Image 1 returns all n images from a single request. Gemini returns
+        one image per request, so it - and GPT Image 1 if the multi-image
+        request fails - falls back to n separate generations.
+        
+        Args:
+            concept: Design concept variant
+            side: 'front' or 'back'
+            model: Specific model to use or AUTO for intelligent selection
+            quality: Quality level affecting model and cost selection
+            n: Number of variants to generate
+            prompt: Full prompt to send instead of the built-in universal prompt
+            
+        Returns:
+            GenerationResult for each variant, saved as {concept}-v1, -v2, ...
+        """
+        if prompt is None:
+            prompt = self._build_universal_prompt(concept, side)
+        
+        selected_model = self._select_model(model, quality)
+        if selected_model == ModelType.GPT_IMAGE_1 and n > 1:
+            print(f"\n🎨 Generating {n} variants of {concept} {side} - {quality} quality")
+            start_time = datetime.now()
+            
+            try:
+                results = self._request_gpt_images(prompt, quality, n)
+                
+                directory = self._output_dir(quality)
+                processing_time = (datetime.now() - start_time).total_seconds()
+                for i, result in enumerate(results, 1):
+                    result.filepath = self._save_image(
+                        result.image_data,
+                        f"{concept}-v{i}",
+                        side,
+                        selected_model.value,
+                        directory
+                    )
+                    result.processing_time = processing_time
+                
+                print(f"✅ Generated {len(results)} variants with {selected_model.value} ({processing_time:.1f}s)")
+                return results
+                
+            except Exception as e:
+                print(f"⚠️ Multi-image request failed ({e}), generating variants one at a time")
+        
+        return [
+            self.generate_card(f"{concept}-v{i}", side, model, quality, prompt=prompt)
+            for i in range(1, n + 1)
+        ]
+
     def _select_model(self, requested: ModelType, quality: str) -> Optional[ModelType]:
         """Intelligent model selection based on requirements and availability"""
         
@@ -231,66 +356,65 @@ class ModernHybridWorkflow:
 
     def _generate_with_gpt_image(self, prompt: str, quality: str) -> GenerationResult:
         """Generate with OpenAI GPT Image 1"""
+        try:
+            return self._request_gpt_images(prompt, quality, n=1)[0]
+            
+        except Exception as e:
+            return GenerationResult(
+                success=False,
+                error_message=f"OpenAI generation failed: {e}",
+                model_used=ModelType.GPT_IMAGE_1.value
+            )
+
+    def _request_gpt_images(self, prompt: str, quality: str, n: int) -> List[GenerationResult]:
+        """Request n images for one prompt from GPT Image 1, raising on failure"""
         
-        # Map quality to OpenAI parameters
-        quality_settings = {
-            "draft": {"quality": "low", "size": "1024x1024", "cost": self.COSTS["gpt_image_1_low"]},
-            "review": {"quality": "medium", "size": "1536x1024", "cost": self.COSTS["gpt_image_1_medium"]},
-            "production": {"quality": "high", "size": "1536x1024", "cost": self.COSTS["gpt_image_1_high"]}
-        }
+        settings = self.GPT_QUALITY_SETTINGS.get(quality, self.GPT_QUALITY_SETTINGS["production"])
         
-        settings = quality_settings.get(quality, quality_settings["production"])
+        response = self.openai_client.images.generate(
+            model=ModelType.GPT_IMAGE_1.value,
+            prompt=prompt,
+            size=settings["size"],
+            quality=settings["quality"],
+            n=n
+        )
         
-        try:
-            response = self.openai_client.images.generate(
-                model='gpt-image-1',
-                prompt=prompt,
-                size=settings["size"],
-                quality=settings["quality"],
-                n=1
-            )
-            
-            # Extract image data
-            image_data = base64.b64decode(response.data[0].b64_json)
-            
-            # Validate image
+        results = []
+        for image in response.data[:n]:
+            # Extract and validate image data
+            image_data = base64.b64decode(image.b64_json)
             self._validate_image(image_data)
             
-            return GenerationResult(
+            # Billing is per image, not per request
+            results.append(GenerationResult(
                 success=True,
                 image_data=image_data,
-                model_used="gpt-image-1",
+                model_used=ModelType.GPT_IMAGE_1.value,
                 cost_estimate=settings["cost"]
-            )
-            
-        except Exception as e:
-            return GenerationResult(
-                success=False,
-                error_message=f"OpenAI generation failed: {e}",
-                model_used="gpt-image-1"
-            )
+            ))
+        
+        if not results:
+            raise ValueError("No image data in OpenAI response")
+        return results
 
-    def _generate_with_gemini(self, prompt: str) -> GenerationResult:
+    def _generate_with_gemini(self, prompt: str, cached_content: Optional[str] = None) -> GenerationResult:
         """Generate with Google Gemini 2.5 Flash Image"""
         
+        request = {"model": ModelType.GEMINI_FLASH.value, "contents": [prompt]}
+        if cached_content:
+            request["config"] = {"cached_content": cached_content}
+        
         try:
-            response = self.gemini_client.models.generate_content(
-                model='gemini-2.5-flash-image-preview',
-                contents=[prompt]
-            )
+            response = self.gemini_client.models.generate_content(**request)
             
             # Extract image data from response
-            image_data = None
-            for part in response.candidates[0].content.parts:
-                if hasattr(part, 'inline_data') and part.inline_data:
-                    image_data = part.inline_data.data
-                    break
+            image_data = self._extract_gemini_image(response)
                     
             if not image_data:
                 return GenerationResult(
                     success=False,
                     error_message="No image data in Gemini response",
-                    model_used="gemini-2.5-flash-image-preview"
+                    model_used=ModelType.GEMINI_FLASH.value
                 )
             
             # Validate image
@@ -299,7 +423,7 @@ class ModernHybridWorkflow:
             return GenerationResult(
                 success=True,
                 image_data=image_data,
-                model_used="gemini-2.5-flash-image-preview",
+                model_used=ModelType.GEMINI_FLASH.value,
                 cost_estimate=self.COSTS["gemini_flash"]
             )
             
@@ -307,11 +431,26 @@ class ModernHybridWorkflow:
             return GenerationResult(
                 success=False,
                 error_message=f"Gemini generation failed: {e}",
-                model_used="gemini-2.5-flash-image-preview"
+                model_used=ModelType.GEMINI_FLASH.value
             )
 
+    @staticmethod
+    def _extract_gemini_image(response) -> Optional[bytes]:
+        """Return the first inline image in a Gemini response, if any"""
+        for part in response.candidates[0].content.parts:
+            if hasattr(part, 'inline_data') and part.inline_data:
+                return part.inline_data.data
+        return None
+
     def _build_universal_prompt(self, concept: str, side: str) -> str:
         """Build universal prompt optimized for both models"""
+        key = (concept, side)
+        if key not in self._universal_prompts:
+            self._universal_prompts[key] = self._render_universal_prompt(concept, side)
+        return self._universal_prompts[key]
+
+    def _render_universal_prompt(self, concept: str, side: str) -> str:
+        """Render the universal prompt text for one concept and side"""
         
         base_prompt = f"""Professional business card design for premium rehabilitation practice:
 
@@ -349,27 +488,36 @@ BACK CARD LAYOUT:
 - Maximum negative space for sophisticated impact"""
 
         # Add concept-specific styling
-        concept_styles = {
-            "Clinical-Precision": "Medical authority focus, symmetric layout, clinical trust",
-            "Athletic-Edge": "Dynamic energy, performance-focused design elements",
-            "Luxury-Wellness": "Equinox-level luxury, spa-like sophistication"
-        }
-        
-        style_spec = f"\nDESIGN CONCEPT: {concept_styles.get(concept, 'Premium professional')}"
+        style_spec = f"\nDESIGN CONCEPT: {self.CONCEPT_STYLES.get(concept, 'Premium professional')}"
         
         return base_prompt + layout_spec + style_spec + "\n\nOUTPUT: Flat artboard design ready for professional printing."
 
     def _validate_image(self, image_data: bytes):
         """Validate generated image data"""
+        if not image_data.startswith(IMAGE_SIGNATURES):
+            raise ValueError("Image validation failed: malformed image bytes")
         try:
-            img = Image.open(io.BytesIO(image_data))
-            if img.width < 512 or img.height < 512:
+            if image_data.startswith(PNG_SIGNATURE) and image_data[12:16] == b"IHDR":
+                # Size and colour type sit at fixed offsets in the PNG header,
+                # so the common case never goes through Pillow
+                width, height = struct.unpack(">II", image_data[16:24])
+                rgb_mode = image_data[25] in PNG_RGB_COLOR_TYPES
+            else:
+                img = Image.open(io.BytesIO(image_data), formats=IMAGE_FORMATS)
+                width, height = img.size
+                rgb_mode = img.mode in ['RGB', 'RGBA']
+            
+            if width < 512 or height < 512:
                 raise ValueError("Generated image resolution too low")
-            if img.mode not in ['RGB', 'RGBA']:
+            if not rgb_mode:
                 raise ValueError("Invalid image color mode")
         except Exception as e:
             raise ValueError(f"Image validation failed: {e}")
 
+    def _output_dir(self, quality: str) -> Path:
+        """Directory that cards of a quality level are saved to"""
+        return self.production_dir if quality == "production" else self.drafts_dir
+
     def _save_image(
         self, 
         image_data: bytes, 
@@ -424,6 +572,196 @@ BACK CARD LAYOUT:
         
         return results
 
+    def generate_cards_batch(
+        self,
+        cards: List[Tuple[str, str]],
+        model: ModelType = ModelType.AUTO,
+        quality: Literal["draft", "review", "production"] = "production",
+        max_workers: int = 4,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> List[GenerationResult]:
+        """
+        Generate several cards in one call
+
+        Identical (concept, side) pairs are generated once, and the distinct
+        cards are requested concurrently since each one is a remote API call.
+
+        Args:
+            cards: List of (concept, side) pairs
+            model: Specific model to use or AUTO for intelligent selection
+            quality: Quality level for all cards
+            max_workers: Maximum concurrent API requests
+            progress_callback: Called with percent complete after each card
+
+        Returns:
+            GenerationResult for each entry in cards, in the same order
+        """
+        unique_cards = list(dict.fromkeys(cards))
+        if not unique_cards:
+            return []
+
+        results: Dict[Tuple[str, str], GenerationResult] = {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_cards))) as executor:
+            future_to_card = {
+                executor.submit(self.generate_card, concept, side, model, quality): (concept, side)
+                for concept, side in unique_cards
+            }
+
+            for future in as_completed(future_to_card):
+                results[future_to_card[future]] = future.result()
+
+                if progress_callback:
+                    progress_callback(len(results) / len(unique_cards) * 100.0)
+
+        return [results[card] for card in cards]
+
+    def generate_gemini_batch(
+        self,
+        prompts: Dict[str, str],
+        side: str = "front",
+        quality: Literal["draft", "review", "production"] = "review",
+        poll_interval: float = GEMINI_BATCH_POLL_SECONDS,
+        timeout: float = GEMINI_BATCH_TIMEOUT_SECONDS
+    ) -> Dict[str, GenerationResult]:
+        """
+        Generate several Gemini images as one batch-mode job
+        
+        All prompts go out in a single inline batch submission billed at half
+        the real-time rate. The job is queued server-side, so only use this
+        where waiting for the whole set is acceptable.
+        
+        Args:
+            prompts: Dict mapping concept names (used in filenames) to full prompts
+            side: 'front' or 'back'
+            quality: Quality level deciding the output directory
+            poll_interval: Seconds between job status checks
+            timeout: Seconds to wait before cancelling the job
+            
+        Returns:
+            GenerationResult for each concept name
+        """
+        model_name = ModelType.GEMINI_FLASH.value
+        
+        def failed(error_message: str) -> Dict[str, GenerationResult]:
+            return {
+                name: GenerationResult(success=False, error_message=error_message, model_used=model_name)
+                for name in prompts
+            }
+        
+        if not prompts:
+            return {}
+        if not self.gemini_available:
+            return failed("Gemini not available for batch generation")
+        
+        print(f"\n📦 Submitting Gemini batch of {len(prompts)} - {quality} quality")
+        start_time = datetime.now()
+        names = list(prompts)
+        
+        try:
+            job = self.gemini_client.batches.create(
+                model=model_name,
+                src=[
+                    {"contents": [{"parts": [{"text": prompts[name]}], "role": "user"}]}
+                    for name in names
+                ],
+                config={"display_name": f"business-cards-{start_time:%Y%m%d_%H%M%S}"}
+            )
+            
+            while job.state not in GEMINI_BATCH_DONE_STATES:
+                if (datetime.now() - start_time).total_seconds() > timeout:
+                    self.gemini_client.batches.cancel(name=job.name)
+                    return failed(f"Gemini batch timed out after {timeout:.0f}s")
+                time.sleep(poll_interval)
+                job = self.gemini_client.batches.get(name=job.name)
+            
+            if job.state not in GEMINI_BATCH_SUCCESS_STATES:
+                return failed(f"Gemini batch ended in {job.state}")
+            
+            responses = job.dest.inlined_responses
+        except Exception as e:
+            return failed(f"Gemini batch generation failed: {e}")
+        
+        processing_time = (datetime.now() - start_time).total_seconds()
+        directory = self._output_dir(quality)
+        results = {}
+        
+        # Inline responses come back in request order
+        for name, inlined in zip(names, responses):
+            try:
+                if inlined.error or not inlined.response:
+                    raise ValueError(f"request failed: {inlined.error}")
+                image_data = self._extract_gemini_image(inlined.response)
+                if not image_data:
+                    raise ValueError("No image data in Gemini response")
+                self._validate_image(image_data)
+                filepath = self._save_image(image_data, name, side, model_name, directory)
+            except Exception as e:
+                results[name] = GenerationResult(
+                    success=False,
+                    error_message=f"Gemini batch generation failed: {e}",
+                    model_used=model_name
+                )
+                continue
+            
+            results[name] = GenerationResult(
+                success=True,
+                image_data=image_data,
+                filepath=filepath,
+                model_used=model_name,
+                cost_estimate=self.COSTS["gemini_flash_batch"],
+                processing_time=processing_time
+            )
+        
+        # A short response list leaves the remaining prompts unanswered
+        for name in names[len(results):]:
+            results[name] = GenerationResult(
+                success=False,
+                error_message="No response in Gemini batch output",
+                model_used=model_name
+            )
+        
+        print(f"✅ Gemini batch finished ({processing_time:.1f}s)")
+        return results
+
+    def create_gemini_context_cache(
+        self,
+        prompt: str,
+        ttl_seconds: int = GEMINI_CONTEXT_CACHE_TTL_SECONDS
+    ) -> Optional[str]:
+        """
+        Upload a prompt prefix shared by several requests to Gemini's context cache
+        
+        Requests passing the returned name as cached_content send only their own
+        text; the cached prefix is billed once plus the reduced cached-token rate.
+        
+        Returns:
+            Cache name, or None when caching is unavailable (e.g. the prefix is
+            below the model's minimum cacheable size) and full prompts must be sent
+        """
+        if not self.gemini_available:
+            return None
+        
+        try:
+            cache = self.gemini_client.caches.create(
+                model=ModelType.GEMINI_FLASH.value,
+                config={
+                    "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+                    "ttl": f"{ttl_seconds}s"
+                }
+            )
+            return cache.name
+        except Exception as e:
+            print(f"⚠️ Gemini context cache unavailable, sending full prompts: {e}")
+            return None
+
+    def delete_gemini_context_cache(self, name: str) -> None:
+        """Delete a context cache early instead of paying storage until its TTL"""
+        try:
+            self.gemini_client.caches.delete(name=name)
+        except Exception as e:
+            print(f"⚠️ Could not delete Gemini context cache {name}: {e}")
+
     def check_api_status(self):
         """Check status of both API connections"""
         print("\n🔍 API Status Check:")
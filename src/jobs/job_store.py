@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Redis-backed Job Store for the Business Card Generator API
+
+Keeps generation job state in Redis so every API worker sees the same
+jobs, instead of each process holding its own in-memory dict.
+
+Key layout:
+- job:{id}            Hash with the job fields (JSON for nested values)
+- jobs:by_created     Sorted set of job ids scored by created_at epoch
+- jobs:user:{uid}:by_created
+                      Same, restricted to jobs owned by one user
+
+Retention: job hashes expire JOB_TTL_SECONDS after their last update, index
+entries older than that are trimmed on every create, and once more than
+MAX_JOBS are indexed the oldest finished jobs are evicted first-in first-out.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+from redis.exceptions import NoScriptError
+
+# Jobs are transient; keep them around for a day after the last update
+JOB_TTL_SECONDS = 24 * 3600
+
+# Hard cap on indexed jobs; beyond it the oldest finished jobs are evicted
+MAX_JOBS = 10_000
+
+FINISHED_STATUSES = ("completed", "failed")
+
+JOBS_BY_CREATED_KEY = "jobs:by_created"
+
+# Fields stored as JSON strings inside the job hash
+JSON_FIELDS = ("request", "metadata", "results")
+
+# Epoch-second timestamps (time.time()) stored as plain numbers
+TIMESTAMP_FIELDS = ("created_at", "updated_at")
+
+JOB_UPDATE_SCRIPT = Path(__file__).parent / "job_update.lua"
+
+
+def job_key(job_id: str) -> str:
+    """Redis key for a single job hash"""
+    return f"job:{job_id}"
+
+
+def user_jobs_key(user_id: str) -> str:
+    """Redis key for the sorted set of jobs owned by a user"""
+    return f"jobs:user:{user_id}:by_created"
+
+
+class JobStore:
+    """Store and query generation jobs in Redis"""
+
+    def __init__(self, redis_client, ttl: int = JOB_TTL_SECONDS, max_jobs: int = MAX_JOBS):
+        """
+        Initialize job store
+
+        Args:
+            redis_client: redis.asyncio client created with decode_responses=True
+            ttl: Seconds a job hash lives after its last update
+            max_jobs: Indexed jobs kept before finished ones are evicted
+        """
+        self.redis = redis_client
+        self.ttl = ttl
+        self.max_jobs = max_jobs
+        self.update_script = JOB_UPDATE_SCRIPT.read_text()
+        self.update_sha: Optional[str] = None
+
+    async def load_scripts(self) -> str:
+        """Load the job update Lua script into Redis and cache its SHA"""
+        self.update_sha = await self.redis.script_load(self.update_script)
+        return self.update_sha
+
+    async def create(self, job: Dict[str, Any]) -> None:
+        """Persist a new job and index it for listing"""
+        job_id = job["id"]
+        created_at = job["created_at"]
+
+        # Index entries older than the TTL point at hashes that have expired
+        stale_before = created_at - self.ttl
+
+        pipe = self.redis.pipeline()
+        pipe.hset(job_key(job_id), mapping=self._encode(job))
+        pipe.expire(job_key(job_id), self.ttl)
+        pipe.zadd(JOBS_BY_CREATED_KEY, {job_id: created_at})
+        pipe.zremrangebyscore(JOBS_BY_CREATED_KEY, "-inf", stale_before)
+        if job.get("user_id"):
+            pipe.zadd(user_jobs_key(job["user_id"]), {job_id: created_at})
+            pipe.zremrangebyscore(user_jobs_key(job["user_id"]), "-inf", stale_before)
+            pipe.expire(user_jobs_key(job["user_id"]), self.ttl)
+        pipe.zcard(JOBS_BY_CREATED_KEY)
+        total = (await pipe.execute())[-1]
+
+        if total > self.max_jobs:
+            await self._evict_finished(total - self.max_jobs)
+
+    async def _evict_finished(self, count: int, batch_size: int = 100) -> int:
+        """
+        Delete up to count of the oldest finished jobs, oldest first
+
+        Queued and processing jobs are skipped so eviction never loses work
+        in progress.
+
+        Returns:
+            Number of jobs evicted
+        """
+        evicted: List[Tuple[str, Optional[str]]] = []
+        offset = 0
+
+        while len(evicted) < count:
+            job_ids = await self.redis.zrange(JOBS_BY_CREATED_KEY, offset, offset + batch_size - 1)
+            if not job_ids:
+                break
+            offset += len(job_ids)
+
+            pipe = self.redis.pipeline(transaction=False)
+            for job_id in job_ids:
+                pipe.hmget(job_key(job_id), "status", "user_id")
+            for job_id, (status, user_id) in zip(job_ids, await pipe.execute()):
+                if status is None or status in FINISHED_STATUSES:
+                    evicted.append((job_id, user_id))
+                    if len(evicted) == count:
+                        break
+
+        if evicted:
+            pipe = self.redis.pipeline(transaction=False)
+            for job_id, user_id in evicted:
+                pipe.delete(job_key(job_id))
+                if user_id:
+                    pipe.zrem(user_jobs_key(user_id), job_id)
+            pipe.zrem(JOBS_BY_CREATED_KEY, *[job_id for job_id, _ in evicted])
+            await pipe.execute()
+
+        return len(evicted)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return job fields or None if the job does not exist"""
+        data = await self.redis.hgetall(job_key(job_id))
+        if not data:
+            return None
+        return self._decode(data)
+
+    async def update(self, job_id: str, **fields: Any) -> Optional[Dict[str, Any]]:
+        """
+        Update job fields and refresh the job TTL atomically
+
+        Runs job_update.lua via EVALSHA so the write and TTL refresh cost a
+        single round trip and concurrent updates to one job never interleave.
+
+        Returns:
+            Updated job fields, or None if the job no longer exists
+        """
+        args = self._update_args(fields)
+        if args is None:
+            return await self.get(job_id)
+
+        if self.update_sha is None:
+            await self.load_scripts()
+        try:
+            reply = await self.redis.evalsha(self.update_sha, 1, job_key(job_id), *args)
+        except NoScriptError:
+            # Script cache was flushed (e.g. Redis restart) - load it again
+            await self.load_scripts()
+            reply = await self.redis.evalsha(self.update_sha, 1, job_key(job_id), *args)
+
+        if not reply:
+            return None
+        return self._decode(dict(zip(reply[::2], reply[1::2])))
+
+    def queue_update(self, pipe, job_id: str, **fields: Any) -> None:
+        """
+        Queue the same atomic update as update() on a caller's pipeline
+
+        Sent as EVAL rather than EVALSHA so a flushed script cache cannot fail
+        the rest of the pipeline; Redis still reuses the compiled script.
+        """
+        args = self._update_args(fields)
+        if args is not None:
+            pipe.eval(self.update_script, 1, job_key(job_id), *args)
+
+    def _update_args(self, fields: Dict[str, Any]) -> Optional[List[Any]]:
+        """Build job_update.lua ARGV (TTL, then field/value pairs)"""
+        mapping = self._encode(fields)
+        if not mapping:
+            return None
+
+        args: List[Any] = [self.ttl]
+        for name, value in mapping.items():
+            args.extend((name, value))
+        return args
+
+    async def list_jobs(
+        self,
+        user_id: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        List jobs newest first
+
+        Args:
+            user_id: Only return jobs owned by this user (optional)
+            limit: Maximum number of jobs to return
+            offset: Number of jobs to skip
+
+        Returns:
+            Tuple of (jobs, total matching jobs)
+        """
+        index_key = user_jobs_key(user_id) if user_id else JOBS_BY_CREATED_KEY
+
+        # ZREVRANGE treats negative indexes as counted from the end, so a
+        # zero or negative window would return the whole index
+        offset = max(offset, 0)
+        if limit < 1:
+            return [], await self.redis.zcard(index_key)
+
+        pipe = self.redis.pipeline()
+        pipe.zcard(index_key)
+        pipe.zrevrange(index_key, offset, offset + limit - 1)
+        total, job_ids = await pipe.execute()
+
+        return await self._get_many(index_key, job_ids), total
+
+    async def _get_many(self, index_key: str, job_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch several jobs in one pipeline, pruning ids whose hash expired"""
+        if not job_ids:
+            return []
+
+        pipe = self.redis.pipeline()
+        for job_id in job_ids:
+            pipe.hgetall(job_key(job_id))
+        hashes = await pipe.execute()
+
+        jobs = []
+        expired = []
+        for job_id, data in zip(job_ids, hashes):
+            if data:
+                jobs.append(self._decode(data))
+            else:
+                expired.append(job_id)
+
+        if expired:
+            await self.redis.zrem(index_key, *expired)
+        return jobs
+
+    @staticmethod
+    def _encode(fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten job fields into Redis hash string values"""
+        encoded = {}
+        for name, value in fields.items():
+            if value is None:
+                continue
+            if name in JSON_FIELDS:
+                encoded[name] = orjson.dumps(value, default=str)
+            elif isinstance(value, datetime):
+                encoded[name] = value.isoformat()
+            else:
+                encoded[name] = str(value)
+        return encoded
+
+    @staticmethod
+    def _decode(data: Dict[str, str]) -> Dict[str, Any]:
+        """Restore typed job fields from a Redis hash"""
+        job: Dict[str, Any] = dict(data)
+        for name in JSON_FIELDS:
+            if name in job:
+                job[name] = orjson.loads(job[name])
+        for name in TIMESTAMP_FIELDS:
+            if name in job:
+                job[name] = float(job[name])
+        if "progress" in job:
+            job["progress"] = float(job["progress"])
+        return job
@@ -0,0 +1,17 @@
+-- Atomically update a job hash and refresh its TTL in a single round trip
+--
+-- KEYS[1]  job:{id}
+-- ARGV[1]  TTL in seconds
+-- ARGV[2+] field/value pairs to set
+--
+-- Returns the updated hash, or nil if the job does not exist (expired or
+-- never created) so late progress updates cannot resurrect a partial job.
+
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+
+redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+
+return redis.call('HGETALL', KEYS[1])
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Background Generation Tasks
+
+Celery tasks that run generation jobs in dedicated worker processes and
+record their progress in the shared job store.
+
+Each worker process keeps one event loop and one Redis connection pool for
+its lifetime; the async job bodies run on that loop and push blocking
+model calls to threads.
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Dict
+
+import structlog
+from celery.signals import worker_init
+from prometheus_client import Histogram
+from redis import asyncio as aioredis
+
+from celery_app import celery_app
+from hybrid.modern_workflow import ModernHybridWorkflow, ModelType
+from cache.redis_cache import GenerationCache
+from jobs.job_store import JobStore
+
+logger = structlog.get_logger(__name__)
+
+GENERATION_DURATION = Histogram('generation_duration_seconds', 'Generation duration')
+
+# Workflow built once in the worker parent by preload_workflow, so every prefork
+# child inherits it. Stays None with PRELOAD_MODELS=0, or outside a worker, and
+# each child then builds its own on first use.
+WORKFLOW = None
+
+# Per worker process state, created lazily in the child after fork
+worker_state: Dict[str, Any] = {
+    "loop": None,
+    "workflow": None,
+    "redis": None,
+    "job_store": None,
+    "cache": None
+}
+
+# Pending fire-and-forget job progress updates
+progress_tasks = set()
+
+
+@worker_init.connect
+def preload_workflow(**kwargs):
+    """Build the shared workflow in the worker parent before the pool forks"""
+    global WORKFLOW
+    if os.getenv("PRELOAD_MODELS", "1") == "1":
+        WORKFLOW = ModernHybridWorkflow()
+
+
+def run_in_worker_loop(coro):
+    """Run a coroutine on this worker process's persistent event loop"""
+    if worker_state["loop"] is None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379')
+        worker_state["redis"] = aioredis.from_url(
+            redis_url,
+            decode_responses=True,
+            max_connections=int(os.getenv('REDIS_MAX_CONNECTIONS', '64'))
+        )
+        worker_state["workflow"] = WORKFLOW or ModernHybridWorkflow()
+        worker_state["job_store"] = JobStore(worker_state["redis"])
+        worker_state["cache"] = GenerationCache(worker_state["redis"])
+        worker_state["loop"] = loop
+
+        logger.info("Worker services initialized", pid=os.getpid(), redis_url=redis_url)
+
+    return worker_state["loop"].run_until_complete(coro)
+
+
+@celery_app.task(name="jobs.process_generation_job")
+def process_generation_job(job_id: str, request: Dict[str, Any]):
+    """Celery entry point for a single card generation job"""
+    run_in_worker_loop(run_generation_job(job_id, request))
+
+
+@celery_app.task(name="jobs.process_batch_job")
+def process_batch_job(job_id: str, request: Dict[str, Any]):
+    """Celery entry point for a batch generation job"""
+    run_in_worker_loop(run_batch_job(job_id, request))
+
+
+async def run_generation_job(job_id: str, request: Dict[str, Any]):
+    """Process single generation job"""
+    start_time = time.time()
+    job_store = worker_state["job_store"]
+    cache = worker_state["cache"]
+    
+    try:
+        logger.info("Starting generation", job_id=job_id)
+        
+        # Check cache first; a local hit needs no Redis read at all
+        cache_key = f"{request['concept']}:{request['side']}:{request['quality']}:{request['model']}"
+        cached_result = cache.local.get(cache_key)
+        
+        if cached_result is None:
+            # Mark the job as processing and read the shared cache in one round trip
+            pipe = worker_state["redis"].pipeline(transaction=False)
+            job_store.queue_update(pipe, job_id, status="processing", progress=10.0, updated_at=time.time())
+            cache.queue_get(pipe, cache_key)
+            _, raw_result = await pipe.execute()
+            cached_result = cache.load(cache_key, raw_result)
+        
+        if cached_result:
+            logger.info("Using cached result", job_id=job_id, cache_key=cache_key)
+            await job_store.update(
+                job_id,
+                result_url=cached_result.filepath,
+                status="completed",
+                progress=100.0,
+                updated_at=time.time()
+            )
+            return
+        
+        # Coalesce with an identical job that is already generating
+        is_leader = await cache.acquire_inflight(cache_key, job_id)
+        if not is_leader:
+            logger.info("Waiting for in-flight generation", job_id=job_id, cache_key=cache_key)
+            shared_result = await cache.wait_for_inflight(cache_key)
+            
+            if shared_result:
+                await job_store.update(
+                    job_id,
+                    result_url=shared_result.filepath,
+                    status="completed",
+                    progress=100.0,
+                    updated_at=time.time()
+                )
+                return
+        
+        try:
+            # Update progress
+            await job_store.update(job_id, progress=30.0, updated_at=time.time())
+            
+            # Determine model
+            model = ModelType.AUTO
+            if request["model"]:
+                model = ModelType(request["model"])
+            
+            # Generate card in a thread so progress updates keep flowing
+            result = await asyncio.to_thread(
+                worker_state["workflow"].generate_card,
+                concept=request["concept"],
+                side=request["side"],
+                model=model,
+                quality=request["quality"]
+            )
+            
+            # Cache the result and record the outcome in one round trip
+            pipe = worker_state["redis"].pipeline(transaction=False)
+            if result.success:
+                cache.queue_store(pipe, cache_key, result)
+                job_store.queue_update(
+                    pipe,
+                    job_id,
+                    status="completed",
+                    progress=100.0,
+                    result_url=result.filepath,
+                    metadata={
+                        "model_used": result.model_used,
+                        "cost_estimate": result.cost_estimate,
+                        "processing_time": result.processing_time
+                    },
+                    updated_at=time.time()
+                )
+            else:
+                job_store.queue_update(
+                    pipe,
+                    job_id,
+                    status="failed",
+                    error_message=result.error_message,
+                    updated_at=time.time()
+                )
+            await pipe.execute()
+        finally:
+            if is_leader:
+                await cache.release_inflight(cache_key, job_id)
+        
+        if result.success:
+            logger.info(
+                "Generation completed successfully",
+                job_id=job_id,
+                filepath=result.filepath,
+                model=result.model_used,
+                processing_time=result.processing_time
+            )
+        else:
+            logger.error(
+                "Generation failed",
+                job_id=job_id,
+                error=result.error_message
+            )
+        
+        # Record metrics
+        duration = time.time() - start_time
+        GENERATION_DURATION.observe(duration)
+        
+    except Exception as e:
+        logger.error("Job processing failed", job_id=job_id, error=str(e))
+        
+        await job_store.update(
+            job_id,
+            status="failed",
+            error_message=str(e),
+            updated_at=time.time()
+        )
+
+
+async def run_batch_job(job_id: str, request: Dict[str, Any]):
+    """Process batch generation job"""
+    job_store = worker_state["job_store"]
+    
+    try:
+        # Update job status
+        await job_store.update(
+            job_id,
+            status="processing",
+            progress=0.0,
+            updated_at=time.time()
+        )
+        
+        logger.info("Starting batch generation", job_id=job_id)
+        
+        model = ModelType.AUTO
+        if request["model"]:
+            model = ModelType(request["model"])
+        
+        # Generate all cards in one workflow call, in a thread
+        cards = [(concept, side) for concept in request["concepts"] for side in request["sides"]]
+        loop = asyncio.get_running_loop()
+        results = await asyncio.to_thread(
+            worker_state["workflow"].generate_cards_batch,
+            cards,
+            model=model,
+            quality=request["quality"],
+            progress_callback=lambda p: loop.call_soon_threadsafe(update_job_progress, job_id, p)
+        )
+        
+        # Let in-flight progress updates land before marking the job complete
+        await asyncio.gather(*progress_tasks)
+        
+        # Update job with results
+        await job_store.update(
+            job_id,
+            status="completed",
+            progress=100.0,
+            results=[
+                {
+                    "concept": concept,
+                    "side": side,
+                    "success": r.success,
+                    "filepath": r.filepath,
+                    "error": r.error_message
+                }
+                for (concept, side), r in zip(cards, results)
+            ],
+            updated_at=time.time()
+        )
+        
+        logger.info(
+            "Batch generation completed",
+            job_id=job_id,
+            total_results=len(results),
+            successful=sum(1 for r in results if r.success)
+        )
+        
+    except Exception as e:
+        logger.error("Batch job processing failed", job_id=job_id, error=str(e))
+        
+        await job_store.update(
+            job_id,
+            status="failed",
+            error_message=str(e),
+            updated_at=time.time()
+        )
+
+
+def update_job_progress(job_id: str, progress: float):
+    """Schedule a job progress update from a synchronous progress callback"""
+    task = asyncio.get_running_loop().create_task(
+        worker_state["job_store"].update(
+            job_id,
+            progress=progress,
+            updated_at=time.time()
+        )
+    )
+    # Hold a reference until the update lands so the task is not collected
+    progress_tasks.add(task)
+    task.add_done_callback(progress_tasks.discard)
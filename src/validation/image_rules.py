@@ -11,8 +11,15 @@ from pathlib import Path
 from typing import Tuple, Union
 from PIL import Image
 
+from validation.signatures import IMAGE_FORMATS, IMAGE_SIGNATURES, JPEG_SIGNATURE, PNG_SIGNATURE
+
+# Standard business card size in inches
+CARD_WIDTH_INCHES = 3.5
+CARD_HEIGHT_INCHES = 2.0
+CARD_ASPECT_RATIO = CARD_WIDTH_INCHES / CARD_HEIGHT_INCHES
+
 def validate_min_resolution(
-    image_data: Union[bytes, str, Path], 
+    image_data: Union[bytes, str, Path, Image.Image], 
     min_width: int = 512, 
     min_height: int = 512
 ) -> bool:
@@ -20,7 +27,7 @@ def validate_min_resolution(
     Validate that image meets minimum resolution requirements
     
     Args:
-        image_data: Image data as bytes, file path, or Path object
+        image_data: Image data as bytes, file path, Path object, or opened image
         min_width: Minimum width in pixels (default: 512)
         min_height: Minimum height in pixels (default: 512)
         
@@ -37,14 +44,14 @@ def validate_min_resolution(
         raise ValueError(f"Invalid image data: {e}")
 
 def validate_color_mode(
-    image_data: Union[bytes, str, Path], 
+    image_data: Union[bytes, str, Path, Image.Image], 
     allowed_modes: Tuple[str, ...] = ("RGB", "RGBA")
 ) -> bool:
     """
     Validate that image uses acceptable color mode
     
     Args:
-        image_data: Image data as bytes, file path, or Path object
+        image_data: Image data as bytes, file path, Path object, or opened image
         allowed_modes: Tuple of allowed PIL color modes (default: RGB, RGBA)
         
     Returns:
@@ -60,15 +67,15 @@ def validate_color_mode(
         raise ValueError(f"Invalid image data: {e}")
 
 def validate_aspect_ratio(
-    image_data: Union[bytes, str, Path], 
-    target_ratio: float = 1.75,  # 3.5" / 2.0" business card ratio
+    image_data: Union[bytes, str, Path, Image.Image], 
+    target_ratio: float = CARD_ASPECT_RATIO,
     tolerance: float = 0.1
 ) -> bool:
     """
     Validate that image has acceptable aspect ratio for business cards
     
     Args:
-        image_data: Image data as bytes, file path, or Path object
+        image_data: Image data as bytes, file path, Path object, or opened image
         target_ratio: Target aspect ratio (default: 1.75 for business cards)
         tolerance: Acceptable deviation from target ratio (default: 0.1)
         
@@ -114,7 +121,7 @@ def validate_file_size(
         return False
 
 def validate_print_dpi(
-    image_data: Union[bytes, str, Path],
+    image_data: Union[bytes, str, Path, Image.Image],
     min_dpi: float = 150.0  # Minimum for reasonable print quality
 ) -> bool:
     """
@@ -124,7 +131,7 @@ def validate_print_dpi(
     assuming standard business card size (3.5" x 2.0")
     
     Args:
-        image_data: Image data as bytes, file path, or Path object
+        image_data: Image data as bytes, file path, Path object, or opened image
         min_dpi: Minimum DPI for print quality (default: 150)
         
     Returns:
@@ -136,13 +143,9 @@ def validate_print_dpi(
     try:
         img = _load_image(image_data)
         
-        # Business card dimensions in inches
-        card_width_inches = 3.5
-        card_height_inches = 2.0
-        
         # Calculate estimated DPI
-        width_dpi = img.width / card_width_inches
-        height_dpi = img.height / card_height_inches
+        width_dpi = img.width / CARD_WIDTH_INCHES
+        height_dpi = img.height / CARD_HEIGHT_INCHES
         
         # Use the lower DPI value (more conservative)
         estimated_dpi = min(width_dpi, height_dpi)
@@ -173,18 +176,25 @@ def validate_business_card_image(image_data: Union[bytes, str, Path]) -> dict:
     """
     results = {}
     
+    # Decode the header once and share it across the image checks instead
+    # of re-opening the data for each one
+    try:
+        img = _load_image(image_data)
+    except ValueError:
+        img = None
+    
     try:
-        results['min_resolution'] = validate_min_resolution(image_data)
+        results['min_resolution'] = img is not None and validate_min_resolution(img)
     except Exception:
         results['min_resolution'] = False
     
     try:
-        results['color_mode'] = validate_color_mode(image_data)
+        results['color_mode'] = img is not None and validate_color_mode(img)
     except Exception:
         results['color_mode'] = False
     
     try:
-        results['aspect_ratio'] = validate_aspect_ratio(image_data)
+        results['aspect_ratio'] = img is not None and validate_aspect_ratio(img)
     except Exception:
         results['aspect_ratio'] = False
     
@@ -194,10 +204,13 @@ def validate_business_card_image(image_data: Union[bytes, str, Path]) -> dict:
         results['file_size'] = False
     
     try:
-        results['print_dpi'] = validate_print_dpi(image_data)
+        results['print_dpi'] = img is not None and validate_print_dpi(img)
     except Exception:
         results['print_dpi'] = False
     
+    if img is not None:
+        img.close()
+    
     # Overall validity - all checks must pass
     results['overall_valid'] = all([
         results['min_resolution'],
@@ -209,12 +222,13 @@ def validate_business_card_image(image_data: Union[bytes, str, Path]) -> dict:
     
     return results
 
-def _load_image(image_data: Union[bytes, str, Path]) -> Image.Image:
+def _load_image(image_data: Union[bytes, str, Path, Image.Image]) -> Image.Image:
     """
     Internal helper to load image from various data sources
     
     Args:
-        image_data: Image data as bytes, file path, or Path object
+        image_data: Image data as bytes, file path, Path object, or an
+            already opened image (returned as is)
         
     Returns:
         PIL.Image.Image: Loaded image object
@@ -223,8 +237,12 @@ def _load_image(image_data: Union[bytes, str, Path]) -> Image.Image:
         ValueError: If image cannot be loaded
     """
     try:
-        if isinstance(image_data, bytes):
-            return Image.open(io.BytesIO(image_data))
+        if isinstance(image_data, Image.Image):
+            return image_data
+        elif isinstance(image_data, bytes):
+            if not image_data.startswith(IMAGE_SIGNATURES):
+                raise ValueError("malformed image bytes")
+            return Image.open(io.BytesIO(image_data), formats=IMAGE_FORMATS)
         elif isinstance(image_data, (str, Path)):
             return Image.open(image_data)
         else:
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Image Signatures for Business Card Generator
+
+Magic bytes of the image formats the APIs return. Kept apart from
+image_rules so callers can check bytes without importing Pillow.
+"""
+
+# Magic bytes of the formats the image APIs return (PNG, JPEG); other bytes
+# are rejected without handing them to Pillow's decoders
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+JPEG_SIGNATURE = b"\xff\xd8\xff"
+IMAGE_SIGNATURES = (PNG_SIGNATURE, JPEG_SIGNATURE)
+# Matching Pillow plugins, so API bytes skip Pillow's format probing
+IMAGE_FORMATS = ("PNG", "JPEG")
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Precompressed Static Files for the Business Card Generator API
+
+Static assets are compressed once at startup (gzip -9 and, if the brotli
+package is installed, brotli -q 11) and the matching variant is served
+according to Accept-Encoding, instead of re-compressing on every request.
+
+Pages link assets through versioned_url(), which appends a content hash
+(?v=...). Requests carrying the current hash are cached for a year; plain
+URLs get a short max-age and revalidate with the ETag afterwards.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import structlog
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers, QueryParams
+from starlette.types import Scope
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = structlog.get_logger(__name__)
+
+COMPRESSED_SUFFIXES = (".gz", ".br")
+
+# Already-compressed formats gain nothing from another pass
+SKIP_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".webp", ".woff", ".woff2", ".ico")
+
+# A versioned URL names one exact file content, so it can be cached forever
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Unversioned URLs may change on any deploy; revalidate with the ETag
+REVALIDATE_CACHE_CONTROL = "public, max-age=300"
+
+# Served variants, most preferred first
+ENCODINGS = ((".br", "br"), (".gz", "gzip"))
+
+
+def accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Map each content coding in an Accept-Encoding header to its q-value"""
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[coding] = quality
+    return weights
+
+
+def precompress_directory(directory: str) -> List[Path]:
+    """
+    Write .gz and .br siblings for every static asset that needs them
+
+    Variants are only rewritten when missing or older than the source file.
+
+    Returns:
+        Paths of the variants written
+    """
+    written = []
+    for source in Path(directory).rglob("*"):
+        if not source.is_file() or source.suffix in COMPRESSED_SUFFIXES + SKIP_SUFFIXES:
+            continue
+
+        encoders = [(".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            encoders.append((".br", lambda data: brotli.compress(data, quality=11)))
+
+        data = None
+        for suffix, compress in encoders:
+            target = source.with_name(source.name + suffix)
+            if target.exists() and target.stat().st_mtime >= source.stat().st_mtime:
+                continue
+            if data is None:
+                data = source.read_bytes()
+            target.write_bytes(compress(data))
+            written.append(target)
+
+    logger.info("Static assets precompressed", directory=directory, written=len(written))
+    return written
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves .br/.gz variants written by precompress_directory"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Content hash per asset, keyed by (path, mtime_ns, size)
+        self._versions: Dict[Tuple[str, int, int], str] = {}
+
+    def asset_version(self, path: str) -> str:
+        """Short content hash of an asset, recomputed only when the file changes"""
+        full_path, stat_result = self.lookup_path(path)
+        if stat_result is None:
+            raise FileNotFoundError(path)
+
+        key = (full_path, stat_result.st_mtime_ns, stat_result.st_size)
+        version = self._versions.get(key)
+        if version is None:
+            version = hashlib.sha256(Path(full_path).read_bytes()).hexdigest()[:12]
+            self._versions[key] = version
+        return version
+
+    def versioned_url(self, path: str, prefix: str = "/static") -> str:
+        """URL of an asset that changes whenever the asset's content does"""
+        return f"{prefix}/{path}?v={self.asset_version(path)}"
+
+    def _cache_control(self, path: str, scope: Scope) -> str:
+        """Cache forever only when the request names the current content hash"""
+        requested = QueryParams(scope.get("query_string", b"")).get("v")
+        if requested and requested == self.asset_version(path):
+            return IMMUTABLE_CACHE_CONTROL
+        return REVALIDATE_CACHE_CONTROL
+
+    async def get_response(self, path: str, scope: Scope):
+        weights = accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+
+        for suffix, encoding in ENCODINGS:
+            # Unlisted codings fall back to the "*" weight; q=0 refuses them
+            if weights.get(encoding, weights.get("*", 0.0)) <= 0:
+                continue
+
+            full_path, stat_result = self.lookup_path(path + suffix)
+            if stat_result is None:
+                continue
+
+            response = await super().get_response(path + suffix, scope)
+            media_type, _ = mimetypes.guess_type(path)
+            if media_type:
+                if media_type.startswith("text/"):
+                    media_type += "; charset=utf-8"
+                response.headers["content-type"] = media_type
+            response.headers["content-encoding"] = encoding
+            response.headers["vary"] = "Accept-Encoding"
+            response.headers["cache-control"] = self._cache_control(path, scope)
+            return response
+
+        response = await super().get_response(path, scope)
+        response.headers["vary"] = "Accept-Encoding"
+        response.headers["cache-control"] = self._cache_control(path, scope)
+        return response
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tests for the FastAPI service endpoints
+
+Runs the app in-process against fakeredis with the Celery broker
+stubbed out.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import fakeredis
+import pytest
+from fastapi.testclient import TestClient
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import app as api
+from jobs.job_store import JobStore
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Test client whose job store lives in fakeredis"""
+    redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    api.app.dependency_overrides[api.get_job_store] = lambda: JobStore(redis_client)
+    monkeypatch.setattr(api.celery_app, "send_task", MagicMock())
+    try:
+        yield TestClient(api.app)
+    finally:
+        api.app.dependency_overrides.clear()
+
+
+def called_on_event_loop() -> bool:
+    """True when the caller runs on a thread with a running event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class TestJobSubmission:
+    """Test queueing generation jobs"""
+
+    def test_generate_publishes_off_the_event_loop(self, client):
+        """The blocking broker publish should run in a worker thread"""
+        on_loop = []
+        api.celery_app.send_task.side_effect = lambda *args, **kwargs: on_loop.append(called_on_event_loop())
+
+        response = client.post("/api/generate", json={"concept": "Athletic-Edge"})
+
+        assert response.status_code == 200
+        assert on_loop == [False]
+        name, = api.celery_app.send_task.call_args.args
+        assert name == "jobs.process_generation_job"
+        assert api.celery_app.send_task.call_args.kwargs["args"][0] == response.json()["job_id"]
+
+    def test_batch_publishes_off_the_event_loop(self, client):
+        """Batch submissions should publish from a worker thread too"""
+        on_loop = []
+        api.celery_app.send_task.side_effect = lambda *args, **kwargs: on_loop.append(called_on_event_loop())
+
+        response = client.post("/api/generate/batch", json={"concepts": ["Athletic-Edge"]})
+
+        assert response.json()["total_cards"] == 2
+        assert on_loop == [False]
+
+
+class TestJobStatus:
+    """Test reading job status"""
+
+    def test_batch_results_are_returned(self, client):
+        """Batch jobs should expose their type and per-card results"""
+        job_id = client.post("/api/generate/batch", json={"concepts": ["Athletic-Edge"]}).json()["job_id"]
+        results = [{"concept": "Athletic-Edge", "side": "front", "success": True, "filepath": "output/front.png", "error": None}]
+        job_store = api.app.dependency_overrides[api.get_job_store]()
+        asyncio.run(job_store.update(job_id, status="completed", progress=100.0, results=results))
+
+        status = client.get(f"/api/jobs/{job_id}").json()
+        listed, = client.get("/api/jobs").json()["jobs"]
+
+        assert status["type"] == "batch"
+        assert status["results"] == results
+        assert listed["results"] == results
+
+
+class TestHealth:
+    """Test the health endpoint"""
+
+    @pytest.fixture
+    def health_client(self, client, monkeypatch):
+        """Client with Redis, cache and metrics dependencies stubbed"""
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        metrics = MagicMock()
+        metrics.get_summary.return_value = {}
+        api.app.dependency_overrides[api.get_redis] = lambda: redis_client
+        api.app.dependency_overrides[api.get_cache] = lambda: MagicMock()
+        api.app.dependency_overrides[api.get_metrics] = lambda: metrics
+        monkeypatch.setattr(api.celery_app, "control", MagicMock())
+        return client
+
+    def test_workflow_healthy_when_a_worker_answers(self, health_client):
+        """A worker ping reply should mark the workflow healthy"""
+        api.celery_app.control.ping.return_value = [{"celery@worker": {"ok": "pong"}}]
+
+        health = health_client.get("/health").json()
+
+        assert health["status"] == "healthy"
+        assert health["services"]["workflow"] == "healthy"
+
+    @pytest.mark.parametrize("ping", [MagicMock(return_value=[]), MagicMock(side_effect=OSError("broker down"))])
+    def test_workflow_unhealthy_without_workers(self, health_client, ping):
+        """No replies, or an unreachable broker, should degrade the service"""
+        api.celery_app.control.ping = ping
+
+        health = health_client.get("/health").json()
+
+        assert health["status"] == "degraded"
+        assert health["services"]["workflow"] == "unhealthy"
+
+
+class TestLifespan:
+    """Test application startup and shutdown"""
+
+    def test_log_listener_stops_when_startup_fails(self, monkeypatch):
+        """A failed service init should still stop the log listener thread"""
+        log_listener = MagicMock()
+        job_store_class = MagicMock()
+        job_store_class.return_value.load_scripts = AsyncMock(side_effect=ConnectionError("redis down"))
+        monkeypatch.setattr(api, "log_listener", log_listener)
+        monkeypatch.setattr(api, "JobStore", job_store_class)
+
+        with pytest.raises(ConnectionError):
+            with TestClient(api.app):
+                pass
+
+        log_listener.start.assert_called_once()
+        log_listener.stop.assert_called_once()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Tests for the enhanced iterative workflow
+
+Runs EnhancedIterativeWorkflow with a stubbed ModernHybridWorkflow, image
+viewer and asset manager, so no API calls are made.
+"""
+
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import enhanced_iterative_workflow
+from enhanced_iterative_workflow import EnhancedIterativeWorkflow
+from hybrid.modern_workflow import GenerationResult, ModelType
+
+GEMINI_JOBS = {
+    '1': ("Layout one", "layout_1", ModelType.GEMINI_FLASH, "draft"),
+    '2': ("Layout two", "layout_2", ModelType.GEMINI_FLASH, "draft")
+}
+
+
+@pytest.fixture
+def workflow(monkeypatch):
+    """Enhanced workflow whose model workflow is a MagicMock"""
+    for name in ("ModernHybridWorkflow", "ImageViewer", "RealAssetManager"):
+        monkeypatch.setattr(enhanced_iterative_workflow, name, MagicMock())
+    enhanced = EnhancedIterativeWorkflow(use_cache=False)
+    enhanced.workflow.generate_card.side_effect = lambda concept, **kwargs: GenerationResult(
+        success=True, filepath=f"output/{concept}.png", cost_estimate=0.005
+    )
+    return enhanced
+
+
+@pytest.fixture
+def cached_workflow(workflow, tmp_path):
+    """Enhanced workflow with the prompt cache on, writing real files under tmp_path"""
+    def generate_card(concept, **kwargs):
+        filepath = tmp_path / f"{concept}.png"
+        filepath.write_bytes(b"png")
+        return GenerationResult(success=True, filepath=str(filepath), model_used="gemini", cost_estimate=0.005)
+
+    workflow.use_cache = True
+    workflow.cache_dir = tmp_path / "prompts"
+    workflow.workflow.generate_card.side_effect = generate_card
+    return workflow
+
+
+def generate(workflow, prompt="Layout one"):
+    """Generate one option through the cache-aware path"""
+    return workflow._generate_with_enhanced_prompt(prompt, "layout_1", ModelType.GEMINI_FLASH, "draft")
+
+
+class TestPromptCache:
+    """Test reusing images from earlier runs for identical prompts"""
+
+    def test_identical_prompt_reuses_image_at_no_cost(self, cached_workflow):
+        """A second run of the same prompt should skip the API and cost nothing"""
+        first = generate(cached_workflow)
+        second = generate(cached_workflow)
+
+        assert cached_workflow.workflow.generate_card.call_count == 1
+        assert second.success
+        assert second.filepath == first.filepath
+        assert second.model_used == "gemini"
+        assert second.cost_estimate == 0.0
+
+    def test_different_prompt_misses(self, cached_workflow):
+        """Entries are keyed by the prompt text"""
+        generate(cached_workflow, "Layout one")
+        generate(cached_workflow, "Layout two")
+
+        assert cached_workflow.workflow.generate_card.call_count == 2
+        assert len(list(cached_workflow.cache_dir.glob("*.json"))) == 2
+
+    def test_missing_image_is_regenerated(self, cached_workflow):
+        """An entry whose image was deleted should not be reused"""
+        Path(generate(cached_workflow).filepath).unlink()
+
+        result = generate(cached_workflow)
+
+        assert cached_workflow.workflow.generate_card.call_count == 2
+        assert Path(result.filepath).exists()
+        assert result.cost_estimate == 0.005
+
+    def test_corrupt_entry_is_a_miss(self, cached_workflow):
+        """Unreadable cache files should fall back to generating"""
+        generate(cached_workflow)
+        cache_file, = cached_workflow.cache_dir.glob("*.json")
+        cache_file.write_text("{not json")
+
+        generate(cached_workflow)
+
+        assert cached_workflow.workflow.generate_card.call_count == 2
+
+    def test_cache_disabled_neither_reads_nor_writes(self, cached_workflow):
+        """use_cache=False should always call the API and store nothing"""
+        cached_workflow.use_cache = False
+
+        generate(cached_workflow)
+        generate(cached_workflow)
+
+        assert cached_workflow.workflow.generate_card.call_count == 2
+        assert not cached_workflow.cache_dir.exists()
+
+    def test_failed_results_are_not_stored(self, cached_workflow):
+        """Only successful generations should be remembered"""
+        cached_workflow.workflow.generate_card.side_effect = lambda **kwargs: GenerationResult(
+            success=False, error_message="rate limited"
+        )
+
+        generate(cached_workflow)
+        generate(cached_workflow)
+
+        assert cached_workflow.workflow.generate_card.call_count == 2
+        assert not cached_workflow.cache_dir.exists()
+
+
+class TestConcurrentVariants:
+    """Test generating the options of a phase together"""
+
+    JOBS = {
+        key: (f"Concept {key}", f"concept_{key}", ModelType.GPT_IMAGE_1, "production")
+        for key in "ABCD"
+    }
+
+    def test_options_run_concurrently(self, workflow):
+        """All four options should be in flight at the same time"""
+        barrier = threading.Barrier(len(self.JOBS), timeout=5)
+
+        def generate_card(concept, **kwargs):
+            barrier.wait()
+            return GenerationResult(success=True, filepath=f"output/{concept}.png", cost_estimate=0.04)
+
+        workflow.workflow.generate_card.side_effect = generate_card
+
+        images = workflow._generate_variants(self.JOBS, "Concept")
+
+        assert len(images) == 4
+
+    def test_results_are_recorded_in_option_order(self, workflow):
+        """Images, history and cost should follow option order and skip failures"""
+        def generate_card(concept, **kwargs):
+            if concept == "concept_B":
+                return GenerationResult(success=False, error_message="boom")
+            return GenerationResult(success=True, filepath=f"output/{concept}.png", cost_estimate=0.04)
+
+        workflow.workflow.generate_card.side_effect = generate_card
+        display = MagicMock()
+
+        images = workflow._generate_variants(self.JOBS, "Concept", display=display)
+
+        assert images == ["output/concept_A.png", "output/concept_C.png", "output/concept_D.png"]
+        assert workflow.session_history == [
+            "Concept A: output/concept_A.png",
+            "Concept C: output/concept_C.png",
+            "Concept D: output/concept_D.png"
+        ]
+        assert workflow.total_cost == pytest.approx(0.12)
+        assert sorted(call.args[0] for call in display.add.call_args_list) == ["A", "C", "D"]
+
+    def test_shared_prompt_context_cache_is_released(self, workflow):
+        """A Gemini context cache made for the phase should be deleted afterwards"""
+        workflow.workflow.create_gemini_context_cache.return_value = "cachedContents/abc"
+
+        workflow._generate_variants(GEMINI_JOBS, "Layout", shared_prompt="Shared prefix\n")
+
+        workflow.workflow.delete_gemini_context_cache.assert_called_once_with("cachedContents/abc")
+        for call in workflow.workflow.generate_card.call_args_list:
+            assert call.kwargs["cached_content"] == "cachedContents/abc"
+            assert call.kwargs["prompt"] in ("Layout one", "Layout two")
+
+
+class TestBatchMode:
+    """Test choosing between Gemini batch mode and real-time generation"""
+
+    def test_gemini_phases_use_batch_mode(self, workflow):
+        """With Gemini available, batch mode should send one batch request"""
+        workflow.batch_mode = True
+        workflow.workflow.gemini_available = True
+        workflow.workflow.generate_gemini_batch.return_value = {
+            "layout_1": GenerationResult(success=True, filepath="output/layout_1.png"),
+            "layout_2": GenerationResult(success=True, filepath="output/layout_2.png")
+        }
+
+        images = workflow._generate_variants(GEMINI_JOBS, "Layout")
+
+        assert images == ["output/layout_1.png", "output/layout_2.png"]
+        workflow.workflow.generate_card.assert_not_called()
+
+    def test_batch_mode_without_gemini_falls_back_to_real_time(self, workflow):
+        """Without Gemini, batch mode should leave model fallback to generate_card"""
+        workflow.batch_mode = True
+        workflow.workflow.gemini_available = False
+
+        images = workflow._generate_variants(GEMINI_JOBS, "Layout")
+
+        assert images == ["output/layout_1.png", "output/layout_2.png"]
+        workflow.workflow.generate_gemini_batch.assert_not_called()
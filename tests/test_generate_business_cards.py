@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Tests for the v1 GPT Image 1 business card generator
+
+Runs BusinessCardGenerator against a mocked OpenAI client inside a
+temporary working directory, so no API calls are made.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import generate_business_cards
+from generate_business_cards import BusinessCardGenerator, png_info
+from fixtures.mock_openai import BUSINESS_CARD_PNG, TINY_PNG, create_mock_openai_success
+
+
+@pytest.fixture
+def openai_client(monkeypatch, tmp_path):
+    """Mocked OpenAI client, with ./output created under tmp_path"""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-key")
+    monkeypatch.chdir(tmp_path)
+    client = create_mock_openai_success()
+    with patch("openai.OpenAI", return_value=client):
+        yield client
+
+
+class TestImageCache:
+    """Test the exact-match image cache"""
+
+    def test_concepts_do_not_share_cache_entries(self, openai_client):
+        """Concepts share prompts, so each must still get its own image"""
+        generator = BusinessCardGenerator()
+
+        generator.generate_front_card("Clinical-Precision")
+        generator.generate_front_card("Athletic-Edge")
+
+        assert openai_client.images.generate.call_count == 2
+        assert len(list(generator.cache_dir.glob("*.png"))) == 2
+
+    def test_identical_card_reuses_cached_image(self, openai_client):
+        """Generating the same card twice should call the API once"""
+        generator = BusinessCardGenerator()
+
+        first = generator.generate_back_card("Luxury-Wellness")
+        second = generator.generate_back_card("Luxury-Wellness")
+
+        assert openai_client.images.generate.call_count == 1
+        assert first != second
+        assert Path(second).read_bytes() == Path(first).read_bytes()
+
+    def test_cache_bypass_always_calls_api(self, openai_client):
+        """use_cache=False should neither read nor skip the API"""
+        BusinessCardGenerator().generate_front_card("Clinical-Precision")
+        generator = BusinessCardGenerator(use_cache=False)
+
+        generator.generate_front_card("Clinical-Precision")
+
+        assert openai_client.images.generate.call_count == 2
+
+    def test_failed_generation_is_not_cached(self, openai_client):
+        """Only images that were actually saved should be cached"""
+        openai_client.images.generate.side_effect = RuntimeError("boom")
+        generator = BusinessCardGenerator()
+
+        assert generator.generate_front_card("Clinical-Precision") is None
+        assert list(generator.cache_dir.glob("*.png")) == []
+
+    def test_variants_are_generated_and_cached_apart(self, openai_client):
+        """Each variant of each side should be its own API call and cache entry"""
+        generator = BusinessCardGenerator()
+
+        results = generator.generate_variants("Athletic-Edge", n=2, max_workers=2)
+
+        assert set(results) == {"Athletic-Edge-v1", "Athletic-Edge-v2"}
+        assert all(set(sides) == {"front", "back"} for sides in results.values())
+        assert openai_client.images.generate.call_count == 4
+        assert len(list(generator.cache_dir.glob("*.png"))) == 4
+
+
+class TestPngInfo:
+    """Test reading PNG headers without Pillow"""
+
+    def test_reads_size_and_mode(self):
+        """Width, height and colour mode should come from IHDR"""
+        assert png_info(BUSINESS_CARD_PNG) == (1536, 1024, "RGBA")
+        assert png_info(TINY_PNG) == (1, 1, "LA")
+
+    @pytest.mark.parametrize("data", [b"", b"\xff\xd8\xff\xe0 jpeg", BUSINESS_CARD_PNG[:20]])
+    def test_rejects_non_png_data(self, data):
+        """Other formats and truncated headers should give None"""
+        assert png_info(data) is None
+
+
+class TestOutputPath:
+    """Test output filename de-duplication"""
+
+    def test_repeated_prefix_gets_numeric_suffix(self, openai_client):
+        """A second card with the same prefix in one run should not overwrite the first"""
+        generator = BusinessCardGenerator()
+        first = generator._output_path("Athletic-Edge_front")
+        first.write_bytes(b"png")
+
+        second = generator._output_path("Athletic-Edge_front")
+        second.write_bytes(b"png")
+
+        assert first.name == f"ASL_Alex_Shafiro_Athletic-Edge_front_{generator.run_timestamp}.png"
+        assert second.name == f"ASL_Alex_Shafiro_Athletic-Edge_front_{generator.run_timestamp}_2.png"
+        assert generator._output_path("Athletic-Edge_front").name.endswith("_3.png")
+
+    def test_count_rounds_keep_every_file(self, openai_client, monkeypatch):
+        """--count rounds share the run timestamp but should each keep their own files"""
+        monkeypatch.setattr(sys, "argv", ["generate_business_cards.py", "--concept", "Athletic-Edge", "--count", "2", "-y"])
+
+        generate_business_cards.main()
+
+        assert len(list(Path("output").glob("*.png"))) == 4
+
+
+class TestCommandLine:
+    """Test the non-interactive command line"""
+
+    @pytest.fixture
+    def no_tty(self, monkeypatch):
+        """stdin that is not a terminal, with input() forbidden"""
+        stdin = MagicMock()
+        stdin.isatty.return_value = False
+        monkeypatch.setattr(sys, "stdin", stdin)
+        monkeypatch.setattr("builtins.input", MagicMock(side_effect=AssertionError("input() called")))
+
+    def test_non_tty_generates_all_concepts_without_prompting(self, openai_client, no_tty, monkeypatch):
+        """Without a terminal, main() should pick all concepts and never call input()"""
+        monkeypatch.setattr(sys, "argv", ["generate_business_cards.py"])
+
+        generate_business_cards.main()
+
+        assert openai_client.images.generate.call_count == 6
+
+    def test_yes_skips_confirmation(self, openai_client, monkeypatch):
+        """--yes should skip the confirmation prompt on a terminal"""
+        stdin = MagicMock()
+        stdin.isatty.return_value = True
+        monkeypatch.setattr(sys, "stdin", stdin)
+        monkeypatch.setattr("builtins.input", MagicMock(side_effect=AssertionError("input() called")))
+        monkeypatch.setattr(sys, "argv", ["generate_business_cards.py", "--concept", "Clinical-Precision", "--yes"])
+
+        generate_business_cards.main()
+
+        assert openai_client.images.generate.call_count == 2
+
+    def test_count_disables_cache(self, openai_client, no_tty, monkeypatch):
+        """More than one round should request fresh images every time"""
+        monkeypatch.setattr(sys, "argv", ["generate_business_cards.py", "--concept", "Clinical-Precision", "--count", "2"])
+
+        generate_business_cards.main()
+
+        assert openai_client.images.generate.call_count == 4
+
+    @pytest.mark.parametrize("option", ["--count", "--variants"])
+    def test_rejects_non_positive_counts(self, option, monkeypatch):
+        """--count and --variants below one should be usage errors"""
+        monkeypatch.setattr(sys, "argv", ["generate_business_cards.py", option, "0"])
+
+        with pytest.raises(SystemExit) as exc_info:
+            generate_business_cards.parse_args()
+        assert exc_info.value.code == 2
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for the generation result cache
+
+Tests the process-local TTL tier in front of Redis using a mocked
+Redis client.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import fakeredis
+import pytest
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from cache.redis_cache import GenerationCache, LocalTTLCache, inflight_key
+from hybrid.modern_workflow import GenerationResult
+
+
+@pytest.fixture
+def redis_client():
+    """Dict-backed stand-in for the few Redis calls the cache makes"""
+    store = {}
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=store.get)
+    pipe = client.pipeline.return_value
+    pipe.set.side_effect = lambda key, value, ex=None: store.__setitem__(key, value)
+    pipe.execute = AsyncMock()
+    client.store = store
+    return client
+
+
+class TestLocalTTLCache:
+    """Test the process-local cache tier"""
+
+    def test_expired_entries_are_dropped(self, monkeypatch):
+        """Entries older than the TTL should miss"""
+        now = [1000.0]
+        monkeypatch.setattr("cache.redis_cache.time.monotonic", lambda: now[0])
+        cache = LocalTTLCache(maxsize=4, ttl=10)
+
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        now[0] += 11
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        """Oldest untouched entry should be evicted when full"""
+        cache = LocalTTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+
+class TestGenerationCache:
+    """Test Redis and local cache interaction"""
+
+    def test_local_hit_skips_redis(self, redis_client):
+        """A cached result should be served without touching Redis"""
+        cache = GenerationCache(redis_client)
+        asyncio.run(cache.cache_result("concept:front:high:auto", GenerationResult(
+            success=True, image_data=b"png", filepath="output/card.png", model_used="gpt-image-1"
+        )))
+
+        result = asyncio.run(cache.get_cached("concept:front:high:auto"))
+
+        assert result.filepath == "output/card.png"
+        assert result.image_data is None
+        redis_client.get.assert_not_called()
+
+    def test_redis_hit_populates_local_cache(self, redis_client):
+        """Results found in Redis should be held locally afterwards"""
+        redis_client.store["gen:concept:back:draft:gemini"] = json.dumps({
+            "success": True, "filepath": "output/back.png", "model_used": "gemini"
+        })
+        cache = GenerationCache(redis_client)
+
+        for _ in range(2):
+            result = asyncio.run(cache.get_cached("concept:back:draft:gemini"))
+            assert result.filepath == "output/back.png"
+        assert redis_client.get.call_count == 1
+
+    def test_failed_results_are_not_cached(self, redis_client):
+        """Failed generations should never be cached"""
+        cache = GenerationCache(redis_client)
+        asyncio.run(cache.cache_result("key", GenerationResult(success=False, error_message="boom")))
+
+        assert asyncio.run(cache.get_cached("key")) is None
+        redis_client.pipeline.return_value.set.assert_not_called()
+
+
+class TestInflightLock:
+    """Test coalescing locks against a real Redis command set"""
+
+    @pytest.fixture
+    def cache(self):
+        """Cache backed by fakeredis, which runs the release script"""
+        return GenerationCache(fakeredis.FakeAsyncRedis(decode_responses=True))
+
+    def test_owner_releases_lock(self, cache):
+        """The job holding the lock should delete it on release"""
+        assert asyncio.run(cache.acquire_inflight("key", "job1"))
+        assert not asyncio.run(cache.acquire_inflight("key", "job2"))
+
+        asyncio.run(cache.release_inflight("key", "job1"))
+
+        assert not asyncio.run(cache.redis.exists(inflight_key("key")))
+
+    def test_stale_owner_keeps_new_lock(self, cache):
+        """A job whose lock expired must not delete the next job's lock"""
+        asyncio.run(cache.acquire_inflight("key", "job1"))
+        asyncio.run(cache.redis.delete(inflight_key("key")))
+        asyncio.run(cache.acquire_inflight("key", "job2"))
+
+        asyncio.run(cache.release_inflight("key", "job1"))
+
+        assert asyncio.run(cache.redis.get(inflight_key("key"))) == "job2"
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Tests for the Redis-backed job store
+
+Runs the store, including the job_update.lua script, against an
+in-memory fakeredis server.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import fakeredis
+import pytest
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from jobs.job_store import JOBS_BY_CREATED_KEY, JobStore, job_key, user_jobs_key
+
+
+@pytest.fixture
+def redis_client():
+    """In-memory Redis that also runs Lua scripts"""
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+def job_store(redis_client):
+    """Job store with a small cap so eviction is easy to reach"""
+    return JobStore(redis_client, ttl=3600, max_jobs=3)
+
+
+def make_job(job_id: str, created_at: float, status: str = "queued", user_id: str = None) -> dict:
+    """Job dict shaped like the ones the API creates"""
+    return {
+        "id": job_id,
+        "status": status,
+        "progress": 0.0,
+        "created_at": created_at,
+        "updated_at": created_at,
+        "request": {"concept": "Clinical-Precision", "side": "front"},
+        "user_id": user_id
+    }
+
+
+class TestCreateAndGet:
+    """Test storing and reading single jobs"""
+
+    def test_round_trip_restores_types(self, job_store):
+        """Nested and numeric fields should come back typed"""
+        asyncio.run(job_store.create(make_job("a", 1000.0, user_id="u1")))
+
+        job = asyncio.run(job_store.get("a"))
+
+        assert job["status"] == "queued"
+        assert job["request"] == {"concept": "Clinical-Precision", "side": "front"}
+        assert job["created_at"] == 1000.0
+        assert job["progress"] == 0.0
+        assert job["user_id"] == "u1"
+
+    def test_missing_job_returns_none(self, job_store):
+        """Unknown ids should read as None"""
+        assert asyncio.run(job_store.get("missing")) is None
+
+    def test_job_hash_expires(self, job_store, redis_client):
+        """Job hashes should carry the store TTL"""
+        asyncio.run(job_store.create(make_job("a", 1000.0)))
+
+        assert 0 < asyncio.run(redis_client.ttl(job_key("a"))) <= 3600
+
+
+class TestUpdate:
+    """Test atomic updates through job_update.lua"""
+
+    def test_update_sets_fields_and_refreshes_ttl(self, job_store, redis_client):
+        """Updates should be applied and the TTL reset"""
+        asyncio.run(job_store.create(make_job("a", 1000.0)))
+        asyncio.run(redis_client.expire(job_key("a"), 10))
+
+        job = asyncio.run(job_store.update("a", status="completed", progress=100.0, metadata={"cost": 0.04}))
+
+        assert job["status"] == "completed"
+        assert job["progress"] == 100.0
+        assert job["metadata"] == {"cost": 0.04}
+        assert asyncio.run(redis_client.ttl(job_key("a"))) > 10
+
+    def test_update_of_missing_job_does_not_create_it(self, job_store, redis_client):
+        """Late updates for an expired job should not resurrect a partial hash"""
+        assert asyncio.run(job_store.update("gone", status="processing", progress=50.0)) is None
+        assert not asyncio.run(redis_client.exists(job_key("gone")))
+
+    def test_update_without_fields_returns_current_job(self, job_store):
+        """None-only updates should skip the script and read the job"""
+        asyncio.run(job_store.create(make_job("a", 1000.0)))
+
+        assert asyncio.run(job_store.update("a", error_message=None))["status"] == "queued"
+
+    def test_update_reloads_flushed_script(self, job_store, redis_client):
+        """A flushed script cache should be reloaded transparently"""
+        asyncio.run(job_store.create(make_job("a", 1000.0)))
+        asyncio.run(job_store.load_scripts())
+        asyncio.run(redis_client.script_flush())
+
+        assert asyncio.run(job_store.update("a", status="processing"))["status"] == "processing"
+
+
+class TestListJobs:
+    """Test newest-first listing and pagination"""
+
+    def test_pages_newest_first(self, redis_client):
+        """Offset and limit should page through jobs newest first"""
+        job_store = JobStore(redis_client)
+        for i in range(5):
+            asyncio.run(job_store.create(make_job(f"job{i}", 1000.0 + i)))
+
+        jobs, total = asyncio.run(job_store.list_jobs(limit=2, offset=1))
+
+        assert total == 5
+        assert [job["id"] for job in jobs] == ["job3", "job2"]
+
+    def test_filters_by_user(self, redis_client):
+        """A user's listing should only contain that user's jobs"""
+        job_store = JobStore(redis_client)
+        asyncio.run(job_store.create(make_job("mine", 1000.0, user_id="u1")))
+        asyncio.run(job_store.create(make_job("theirs", 1001.0, user_id="u2")))
+
+        jobs, total = asyncio.run(job_store.list_jobs(user_id="u1"))
+
+        assert total == 1
+        assert [job["id"] for job in jobs] == ["mine"]
+
+    def test_expired_jobs_are_pruned_from_index(self, redis_client):
+        """Index entries whose hash expired should be dropped while listing"""
+        job_store = JobStore(redis_client)
+        asyncio.run(job_store.create(make_job("a", 1000.0)))
+        asyncio.run(job_store.create(make_job("b", 1001.0)))
+        asyncio.run(redis_client.delete(job_key("a")))
+
+        jobs, _ = asyncio.run(job_store.list_jobs())
+
+        assert [job["id"] for job in jobs] == ["b"]
+        assert asyncio.run(redis_client.zrange(JOBS_BY_CREATED_KEY, 0, -1)) == ["b"]
+
+    def test_empty_or_negative_window_returns_no_jobs(self, redis_client):
+        """limit <= 0 must not turn into an open-ended ZREVRANGE"""
+        job_store = JobStore(redis_client)
+        for i in range(3):
+            asyncio.run(job_store.create(make_job(f"job{i}", 1000.0 + i)))
+
+        assert asyncio.run(job_store.list_jobs(limit=0)) == ([], 3)
+        assert asyncio.run(job_store.list_jobs(limit=-1)) == ([], 3)
+
+        jobs, _ = asyncio.run(job_store.list_jobs(limit=1, offset=-1))
+        assert [job["id"] for job in jobs] == ["job2"]
+
+    def test_endpoint_rejects_out_of_range_paging(self, redis_client):
+        """/api/jobs should validate limit and offset before querying"""
+        from fastapi.testclient import TestClient
+
+        import app as api
+
+        api.app.dependency_overrides[api.get_job_store] = lambda: JobStore(redis_client)
+        try:
+            client = TestClient(api.app)
+            for params in ({"limit": 0}, {"limit": 101}, {"offset": -1}):
+                assert client.get("/api/jobs", params=params).status_code == 422
+            assert client.get("/api/jobs", params={"limit": 100}).json()["jobs"] == []
+        finally:
+            api.app.dependency_overrides.clear()
+
+
+class TestEviction:
+    """Test the MAX_JOBS cap"""
+
+    def test_oldest_finished_jobs_are_evicted_first(self, job_store, redis_client):
+        """Past the cap, the oldest finished jobs go and active ones stay"""
+        asyncio.run(job_store.create(make_job("active", 1000.0, status="processing")))
+        asyncio.run(job_store.create(make_job("done1", 1001.0, status="completed", user_id="u1")))
+        asyncio.run(job_store.create(make_job("done2", 1002.0, status="failed")))
+        asyncio.run(job_store.create(make_job("new", 1003.0)))
+
+        remaining = asyncio.run(redis_client.zrange(JOBS_BY_CREATED_KEY, 0, -1))
+
+        assert remaining == ["active", "done2", "new"]
+        assert asyncio.run(job_store.get("done1")) is None
+        assert asyncio.run(redis_client.zcard(user_jobs_key("u1"))) == 0
+
+    def test_active_jobs_are_never_evicted(self, job_store, redis_client):
+        """With only queued jobs indexed, the cap should be exceeded rather than lose work"""
+        for i in range(4):
+            asyncio.run(job_store.create(make_job(f"job{i}", 1000.0 + i)))
+
+        assert asyncio.run(redis_client.zcard(JOBS_BY_CREATED_KEY)) == 4
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Tests for the background generation tasks
+
+Runs the async job bodies against fakeredis with a stubbed workflow, so
+no Celery worker or model API is involved.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import fakeredis
+import pytest
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+import celery_app
+from cache.redis_cache import GenerationCache
+from hybrid.modern_workflow import GenerationResult
+from jobs import tasks
+from jobs.job_store import JobStore
+
+REQUEST = {"concept": "Clinical-Precision", "side": "front", "quality": "draft", "model": None}
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    """Worker state backed by fakeredis and a stub workflow"""
+    redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    workflow = MagicMock()
+    state = {
+        "loop": None,
+        "workflow": workflow,
+        "redis": redis_client,
+        "job_store": JobStore(redis_client),
+        "cache": GenerationCache(redis_client)
+    }
+    monkeypatch.setattr(tasks, "worker_state", state)
+    asyncio.run(state["job_store"].create({
+        "id": "job1", "status": "queued", "progress": 0.0,
+        "created_at": 1000.0, "updated_at": 1000.0, "request": REQUEST
+    }))
+    return state
+
+
+class TestGenerationJob:
+    """Test the single card job body"""
+
+    def test_successful_generation_completes_job(self, worker):
+        """A successful card should complete the job and be cached"""
+        worker["workflow"].generate_card.return_value = GenerationResult(
+            success=True, filepath="output/card.png", model_used="gemini-2.5-flash-image-preview"
+        )
+
+        asyncio.run(tasks.run_generation_job("job1", REQUEST))
+
+        job = asyncio.run(worker["job_store"].get("job1"))
+        assert job["status"] == "completed"
+        assert job["result_url"] == "output/card.png"
+        assert job["metadata"]["model_used"] == "gemini-2.5-flash-image-preview"
+        assert worker["cache"].local.get("Clinical-Precision:front:draft:None").filepath == "output/card.png"
+        assert not asyncio.run(worker["redis"].exists("inflight:Clinical-Precision:front:draft:None"))
+
+    def test_cached_result_skips_generation(self, worker):
+        """A cache hit should complete the job without calling the workflow"""
+        asyncio.run(worker["cache"].cache_result(
+            "Clinical-Precision:front:draft:None",
+            GenerationResult(success=True, filepath="output/cached.png")
+        ))
+
+        asyncio.run(tasks.run_generation_job("job1", REQUEST))
+
+        assert asyncio.run(worker["job_store"].get("job1"))["result_url"] == "output/cached.png"
+        worker["workflow"].generate_card.assert_not_called()
+
+    def test_failed_generation_fails_job(self, worker):
+        """A failed card should fail the job with the workflow's error"""
+        worker["workflow"].generate_card.return_value = GenerationResult(
+            success=False, error_message="rate limited"
+        )
+
+        asyncio.run(tasks.run_generation_job("job1", REQUEST))
+
+        job = asyncio.run(worker["job_store"].get("job1"))
+        assert job["status"] == "failed"
+        assert job["error_message"] == "rate limited"
+
+
+class TestBatchJob:
+    """Test the batch job body"""
+
+    def test_batch_records_each_card(self, worker):
+        """Every requested card should appear in the job results"""
+        worker["workflow"].generate_cards_batch.return_value = [
+            GenerationResult(success=True, filepath="output/front.png"),
+            GenerationResult(success=False, error_message="boom")
+        ]
+        request = {"concepts": ["Clinical-Precision"], "sides": ["front", "back"], "quality": "draft", "model": None}
+
+        asyncio.run(tasks.run_batch_job("job1", request))
+
+        job = asyncio.run(worker["job_store"].get("job1"))
+        assert job["status"] == "completed"
+        assert [r["success"] for r in job["results"]] == [True, False]
+        assert job["results"][1]["error"] == "boom"
+
+
+class TestWorkflowPreload:
+    """Test building the shared workflow in the worker parent"""
+
+    def test_import_does_not_build_workflow(self):
+        """Importing the tasks module should not set up API clients"""
+        assert tasks.WORKFLOW is None
+
+    def test_worker_init_builds_workflow(self, monkeypatch):
+        """The worker_init handler should build the workflow once"""
+        workflow_class = MagicMock()
+        monkeypatch.delenv("PRELOAD_MODELS", raising=False)
+        monkeypatch.setattr(tasks, "ModernHybridWorkflow", workflow_class)
+        monkeypatch.setattr(tasks, "WORKFLOW", None)
+
+        tasks.preload_workflow()
+
+        assert tasks.WORKFLOW is workflow_class.return_value
+
+    def test_preload_can_be_disabled(self, monkeypatch):
+        """PRELOAD_MODELS=0 should leave each child to build its own"""
+        workflow_class = MagicMock()
+        monkeypatch.setenv("PRELOAD_MODELS", "0")
+        monkeypatch.setattr(tasks, "ModernHybridWorkflow", workflow_class)
+        monkeypatch.setattr(tasks, "WORKFLOW", None)
+
+        tasks.preload_workflow()
+
+        assert tasks.WORKFLOW is None
+        workflow_class.assert_not_called()
+
+
+class TestWorkerMetrics:
+    """Test the worker's Prometheus endpoint"""
+
+    def test_serves_default_registry_without_multiprocess_dir(self, monkeypatch):
+        """Single-process workers should expose their own registry"""
+        server = MagicMock()
+        monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+        monkeypatch.setattr(celery_app, "start_http_server", server)
+
+        celery_app.start_worker_metrics_server()
+
+        server.assert_called_once_with(celery_app.WORKER_METRICS_PORT, registry=celery_app.REGISTRY)
+
+    def test_aggregates_pool_processes_with_multiprocess_dir(self, monkeypatch, tmp_path):
+        """Prefork workers should serve values collected from every pool process"""
+        server = MagicMock()
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+        monkeypatch.setattr(celery_app, "start_http_server", server)
+
+        celery_app.start_worker_metrics_server()
+
+        registry = server.call_args.kwargs["registry"]
+        assert registry is not celery_app.REGISTRY
+        assert any(
+            isinstance(collector, celery_app.multiprocess.MultiProcessCollector)
+            for collector in registry._collector_to_names
+        )
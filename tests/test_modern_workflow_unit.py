@@ -16,7 +16,10 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 from hybrid.modern_workflow import ModernHybridWorkflow, ModelType, GenerationResult
-from fixtures.mock_openai import create_mock_openai_success, TINY_PNG, BUSINESS_CARD_PNG
+from fixtures.mock_openai import (
+    create_mock_openai_success, MockOpenAIImageData, MockOpenAIResponse,
+    TINY_PNG, BUSINESS_CARD_PNG, BUSINESS_CARD_B64
+)
 from fixtures.mock_gemini import create_mock_gemini_success
 
 class TestModelSelection:
@@ -117,6 +120,16 @@ class TestImageValidation:
             
             with pytest.raises(ValueError):
                 wf._validate_image(b"")
+    
+    def test_validate_image_rejects_bad_signature_before_decoding(self):
+        """Bytes without a known image signature should never reach Pillow"""
+        with patch('hybrid.modern_workflow.OpenAI'), patch('hybrid.modern_workflow.genai'):
+            wf = ModernHybridWorkflow()
+            
+            with patch('hybrid.modern_workflow.Image.open') as mock_open:
+                with pytest.raises(ValueError, match="malformed"):
+                    wf._validate_image(b"<html>502 Bad Gateway</html>")
+                mock_open.assert_not_called()
 
 
 class TestPromptBuilding:
@@ -156,6 +169,40 @@ class TestPromptBuilding:
             
             # Should all be different
             assert clinical != athletic != luxury
+    
+    def test_explicit_prompt_overrides_universal_prompt(self, tmp_path, monkeypatch):
+        """generate_card should send a caller-supplied prompt unchanged"""
+        monkeypatch.setenv("GOOGLE_API_KEY", "AIza1234567890123456789")
+        
+        with patch('hybrid.modern_workflow.OpenAI'), patch('hybrid.modern_workflow.genai') as mock_genai:
+            client = create_mock_gemini_success()
+            mock_genai.Client.return_value = client
+            
+            wf = ModernHybridWorkflow()
+            wf.drafts_dir = tmp_path
+            result = wf.generate_card("Enhanced-Layout-A-1", "front", ModelType.GEMINI_FLASH, "review", prompt="custom prompt")
+            
+            assert result.success
+            assert client.models.generate_content.call_args.kwargs["contents"] == ["custom prompt"]
+    
+    def test_cached_content_is_passed_to_gemini(self, tmp_path, monkeypatch):
+        """A Gemini context cache name should reach generate_content config"""
+        monkeypatch.setenv("GOOGLE_API_KEY", "AIza1234567890123456789")
+        
+        with patch('hybrid.modern_workflow.OpenAI'), patch('hybrid.modern_workflow.genai') as mock_genai:
+            client = create_mock_gemini_success()
+            client.caches.create.return_value = MagicMock()
+            client.caches.create.return_value.name = "cachedContents/abc"
+            mock_genai.Client.return_value = client
+            
+            wf = ModernHybridWorkflow()
+            wf.drafts_dir = tmp_path
+            cache_name = wf.create_gemini_context_cache("shared prefix")
+            wf.generate_card("Layout-1", "front", ModelType.GEMINI_FLASH, "review", prompt="delta", cached_content=cache_name)
+            
+            kwargs = client.models.generate_content.call_args.kwargs
+            assert kwargs["contents"] == ["delta"]
+            assert kwargs["config"] == {"cached_content": "cachedContents/abc"}
 
 
 class TestFileSaving:
@@ -249,6 +296,122 @@ class TestCostEstimation:
             assert quality_settings["review"]["cost"] < quality_settings["production"]["cost"]
 
 
+class TestBatchGeneration:
+    """Test batch generation through the workflow"""
+    
+    def test_batch_dedupes_and_preserves_order(self):
+        """Duplicate cards should be generated once and results keep input order"""
+        with patch('hybrid.modern_workflow.OpenAI'), patch('hybrid.modern_workflow.genai'):
+            wf = ModernHybridWorkflow()
+            wf.generate_card = MagicMock(
+                side_effect=lambda concept, side, model, quality: GenerationResult(
+                    success=True, filepath=f"{concept}_{side}.png"
+                )
+            )
+            progress = []
+            
+            cards = [("Clinical-Precision", "front"), ("Athletic-Edge", "back"), ("Clinical-Precision", "front")]
+            results = wf.generate_cards_batch(cards, quality="draft", progress_callback=progress.append)
+            
+            assert [r.filepath for r in results] == [
+                "Clinical-Precision_front.png", "Athletic-Edge_back.png", "Clinical-Precision_front.png"
+            ]
+            assert wf.generate_card.call_count == 2
+            assert progress[-1] == 100.0
+    
+    def test_empty_batch(self):
+        """Empty batch should return no results"""
+        with patch('hybrid.modern_workflow.OpenAI'), patch('hybrid.modern_workflow.genai'):
+            wf = ModernHybridWorkflow()
+            assert wf.generate_cards_batch([]) == []
+
+
+class TestCardVariants:
+    """Test generating several variants of one card"""
+    
+    def test_gpt_variants_come_from_one_request(self, tmp_path, monkeypatch):
+        """GPT Image 1 should return all variants from a single n>1 request"""
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test123456789012345678")
+        
+        with patch('hybrid.modern_workflow.OpenAI') as mock_openai, patch('hybrid.modern_workflow.genai'):
+            client = create_mock_openai_success()
+            client.images.generate.return_value = MockOpenAIResponse(
+                data=[MockOpenAIImageData(b64_json=BUSINESS_CARD_B64)] * 2
+            )
+            mock_openai.return_value = client
+            
+            wf = ModernHybridWorkflow()
+            wf.production_dir = tmp_path
+            results = wf.generate_card_variants("Clinical-Precision", "front", ModelType.GPT_IMAGE_1, "production", n=2)
+            
+            assert client.images.generate.call_count == 1
+            assert client.images.generate.call_args.kwargs["n"] == 2
+            assert [r.success for r in results] == [True, True]
+            assert len({r.filepath for r in results}) == 2
+            assert sum(r.cost_estimate for r in results) == 2 * wf.COSTS["gpt_image_1_high"]
+    
+    def test_gemini_variants_fall_back_to_separate_requests(self):
+        """Gemini should generate each variant with its own request"""
+        with patch('hybrid.modern_workflow.OpenAI'), patch('hybrid.modern_workflow.genai'):
+            wf = ModernHybridWorkflow()
+            wf.generate_card = MagicMock(return_value=GenerationResult(success=True))
+            
+            results = wf.generate_card_variants("Athletic-Edge", "front", ModelType.GEMINI_FLASH, "review", n=3)
+            
+            assert len(results) == 3
+            assert [c.args[0] for c in wf.generate_card.call_args_list] == [
+                "Athletic-Edge-v1", "Athletic-Edge-v2", "Athletic-Edge-v3"
+            ]
+
+
+class TestGeminiBatchGeneration:
+    """Test Gemini batch-mode generation"""
+    
+    def test_batch_saves_each_response(self, tmp_path, monkeypatch):
+        """A finished batch job should yield one saved result per prompt"""
+        monkeypatch.setenv("GOOGLE_API_KEY", "AIza1234567890123456789")
+        
+        with patch('hybrid.modern_workflow.OpenAI'), patch('hybrid.modern_workflow.genai') as mock_genai:
+            client = MagicMock()
+            image_response = create_mock_gemini_success().models.generate_content.return_value
+            client.batches.create.return_value = MagicMock(
+                state="JOB_STATE_SUCCEEDED",
+                dest=MagicMock(inlined_responses=[
+                    MagicMock(error=None, response=image_response),
+                    MagicMock(error="quota exceeded", response=None),
+                ])
+            )
+            mock_genai.Client.return_value = client
+            
+            wf = ModernHybridWorkflow()
+            wf.drafts_dir = tmp_path
+            results = wf.generate_gemini_batch({"Layout-1": "prompt one", "Layout-2": "prompt two"})
+            
+            assert results["Layout-1"].success
+            assert Path(results["Layout-1"].filepath).exists()
+            assert results["Layout-1"].cost_estimate == wf.COSTS["gemini_flash_batch"]
+            assert not results["Layout-2"].success
+            assert "quota exceeded" in results["Layout-2"].error_message
+            
+            src = client.batches.create.call_args.kwargs["src"]
+            assert [r["contents"][0]["parts"][0]["text"] for r in src] == ["prompt one", "prompt two"]
+    
+    def test_failed_batch_job_fails_every_prompt(self, monkeypatch):
+        """A batch job that ends unsuccessfully should fail all prompts"""
+        monkeypatch.setenv("GOOGLE_API_KEY", "AIza1234567890123456789")
+        
+        with patch('hybrid.modern_workflow.OpenAI'), patch('hybrid.modern_workflow.genai') as mock_genai:
+            client = MagicMock()
+            client.batches.create.return_value = MagicMock(state="JOB_STATE_FAILED")
+            mock_genai.Client.return_value = client
+            
+            wf = ModernHybridWorkflow()
+            results = wf.generate_gemini_batch({"Layout-1": "prompt one", "Layout-2": "prompt two"})
+            
+            assert not any(r.success for r in results.values())
+            assert "JOB_STATE_FAILED" in results["Layout-1"].error_message
+
+
 class TestErrorHandling:
     """Test error handling and edge cases"""
     
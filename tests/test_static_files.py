@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests for precompressed static file serving
+
+Tests that assets are compressed once and the variant matching
+Accept-Encoding is served.
+"""
+
+import gzip
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from web.static_files import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    PrecompressedStaticFiles,
+    accepted_encodings,
+    precompress_directory
+)
+
+CSS = b"body { color: #0A0A0A; }\n" * 100
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """Static directory with one stylesheet"""
+    (tmp_path / "style.css").write_bytes(CSS)
+    return tmp_path
+
+
+@pytest.fixture
+def static_files(static_dir):
+    """Precompressed static files for static_dir"""
+    precompress_directory(str(static_dir))
+    return PrecompressedStaticFiles(directory=str(static_dir))
+
+
+@pytest.fixture
+def client(static_files):
+    """Client for an app serving static_files under /static"""
+    app = FastAPI()
+    app.mount("/static", static_files, name="static")
+    return TestClient(app)
+
+
+class TestPrecompression:
+    """Test writing compressed variants"""
+    
+    def test_gzip_variant_written_once(self, static_dir):
+        """Variants should be written on first run and reused afterwards"""
+        written = precompress_directory(str(static_dir))
+        
+        assert static_dir / "style.css.gz" in written
+        assert gzip.decompress((static_dir / "style.css.gz").read_bytes()) == CSS
+        assert precompress_directory(str(static_dir)) == []
+
+
+class TestContentNegotiation:
+    """Test serving the variant matching Accept-Encoding"""
+    
+    def test_serves_gzip_variant(self, static_dir):
+        """Clients accepting gzip should get the precompressed file"""
+        precompress_directory(str(static_dir))
+        app = FastAPI()
+        app.mount("/static", PrecompressedStaticFiles(directory=str(static_dir)), name="static")
+        
+        response = TestClient(app).get("/static/style.css", headers={"Accept-Encoding": "gzip"})
+        
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-type"].startswith("text/css")
+        assert response.content == CSS
+    
+    def test_serves_plain_file_without_accept_encoding(self, static_dir):
+        """Clients not accepting compression should get the original file"""
+        precompress_directory(str(static_dir))
+        app = FastAPI()
+        app.mount("/static", PrecompressedStaticFiles(directory=str(static_dir)), name="static")
+        
+        response = TestClient(app).get("/static/style.css", headers={"Accept-Encoding": "identity"})
+        
+        assert "content-encoding" not in response.headers
+        assert response.content == CSS
+    
+    def test_serves_brotli_variant(self, client):
+        """Brotli should be preferred when the client accepts it"""
+        pytest.importorskip("brotli")
+        
+        response = client.get("/static/style.css", headers={"Accept-Encoding": "gzip, deflate, br"})
+        
+        assert response.headers["content-encoding"] == "br"
+        assert response.headers["content-type"].startswith("text/css")
+        assert response.content == CSS
+    
+    def test_refused_encodings_are_not_served(self, client):
+        """A q=0 coding must never be served, even if it appears in the header"""
+        response = client.get("/static/style.css", headers={"Accept-Encoding": "br;q=0, gzip;q=0"})
+        
+        assert "content-encoding" not in response.headers
+        assert response.content == CSS
+    
+    def test_wildcard_accepts_unlisted_encodings(self, client):
+        """"*" should cover codings the header does not name"""
+        response = client.get("/static/style.css", headers={"Accept-Encoding": "br;q=0, *"})
+        
+        assert response.headers["content-encoding"] == "gzip"
+    
+    def test_parses_quality_values(self):
+        """Accept-Encoding tokens should be split and weighted, not substring matched"""
+        assert accepted_encodings("gzip;q=0.5, BR ; q=0, x-gzip") == {"gzip": 0.5, "br": 0.0, "x-gzip": 1.0}
+        assert accepted_encodings("") == {}
+
+
+class TestCaching:
+    """Test cache headers for versioned and plain asset URLs"""
+    
+    def test_plain_url_revalidates(self, client):
+        """Unversioned URLs may change on deploy, so they get a short max-age"""
+        response = client.get("/static/style.css")
+        
+        assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+        assert "etag" in response.headers
+    
+    def test_versioned_url_is_immutable(self, client, static_files):
+        """The URL carrying the current content hash can be cached forever"""
+        response = client.get(static_files.versioned_url("style.css"))
+        
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    
+    def test_version_changes_with_content(self, static_dir, static_files, client):
+        """Editing an asset should change its URL, and old URLs stop being immutable"""
+        old_url = static_files.versioned_url("style.css")
+        (static_dir / "style.css").write_bytes(CSS + b"a { color: #B8860B; }\n")
+        
+        assert static_files.versioned_url("style.css") != old_url
+        assert client.get(old_url).headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+    
+    def test_etag_revalidation(self, client):
+        """Revalidating with the ETag should return 304"""
+        etag = client.get("/static/style.css").headers["etag"]
+        
+        response = client.get("/static/style.css", headers={"If-None-Match": etag})
+        
+        assert response.status_code == 304
@@ -295,6 +295,15 @@ class TestImageLoading:
         with pytest.raises(ValueError, match="Cannot load image"):
             _load_image(b"not_an_image")
     
+    def test_bad_signature_rejected_before_decoding(self, monkeypatch):
+        """Bytes without a known image signature should never reach Pillow"""
+        def fail_open(*args, **kwargs):
+            raise AssertionError("Image.open should not be called")
+        monkeypatch.setattr(Image, "open", fail_open)
+        
+        with pytest.raises(ValueError, match="malformed image bytes"):
+            _load_image(b"<html>502 Bad Gateway</html>")
+    
     def test_unsupported_type_raises_error(self):
         """Unsupported data type should raise ValueError"""
         with pytest.raises(ValueError, match="Unsupported image_data type"):